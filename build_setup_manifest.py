@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Record which required modules import cleanly, for test_setup.py to read back.
+
+Run after `uv sync` (setup.sh does this). test_setup.py trusts the manifest only
+while it was written by the same interpreter and is newer than uv.lock.
+"""
+
+import importlib
+import json
+import os
+import sys
+
+from test_setup import CHECKS
+
+# Exactly the modules test_setup.py checks for, so the two can't drift apart
+REQUIRED_MODULES = tuple(module for module, *_ in CHECKS)
+
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "setup_manifest.json")
+
+
+def build_manifest() -> dict:
+    modules = {}
+    for name in REQUIRED_MODULES:
+        try:
+            importlib.import_module(name)
+            modules[name] = True
+        except Exception:
+            modules[name] = False
+    return {"python": sys.version, "executable": sys.executable, "modules": modules}
+
+
+if __name__ == "__main__":
+    manifest = build_manifest()
+    tmp_path = f"{MANIFEST_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, MANIFEST_PATH)
+    missing = [name for name, ok in manifest["modules"].items() if not ok]
+    print(f"✅ Wrote {MANIFEST_PATH}")
+    if missing:
+        print(f"⚠️  Not importable: {', '.join(missing)}")
@@ -4,59 +4,116 @@ Demo script showing how uvx runs MCP servers on-demand.
 This script demonstrates the zero-installation approach.
 """
 
-import asyncio
 import os
+import shutil
 import subprocess
 import sys
+from typing import TYPE_CHECKING, Optional
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from mcp import StdioServerParameters
 
 
 def check_uvx():
-    """Check if uvx is available."""
-    try:
-        result = subprocess.run(["uvx", "--version"], capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✅ uvx is available: {result.stdout.strip()}")
-            return True
-        else:
-            print(f"❌ uvx check failed: {result.stderr}")
-            return False
-    except FileNotFoundError:
+    """Check if uvx is available on PATH (without running it)."""
+    path = shutil.which("uvx")
+    if path is None:
         print("❌ uvx not found. Please install uv (which includes uvx):")
         print("   curl -LsSf https://astral.sh/uv/install.sh | sh")
         return False
 
+    print(f"✅ uvx is available: {path}")
+    return True
+
+
+def _uvx_server_params() -> Optional["StdioServerParameters"]:
+    """Return the ClickHouse server params if the demo will launch them via uvx.
+
+    None when an HTTP URL is configured or the command is something else (an
+    installed binary or a custom config), since there is nothing to prewarm then.
+    """
+    from sql2text.example import load_mcp_http_url, load_mcp_server_params
+
+    if load_mcp_http_url():
+        return None
+    params = load_mcp_server_params(server_name="mcp-clickhouse")
+    if os.path.basename(params.command) != "uvx":
+        return None
+    return params
+
+
+async def _prewarm_uvx_cache(
+    params: "StdioServerParameters", timeout: float = 120.0
+) -> None:
+    """Resolve the uvx-launched server into the uv cache so the first connect is warm.
+
+    Runs the same uvx invocation the demo connects with, plus `--help` and with stdin
+    closed, so the server exits as soon as its package is resolved.
+    """
+    import asyncio
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            params.command,
+            *params.args,
+            "--help",
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return
+
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+
 
-async def demo_mcp_with_uvx():
+async def demo_mcp_with_uvx(prewarm: Optional["Future[None]"] = None):
     """Demonstrate MCP server running with uvx."""
+    import asyncio
+
     print("\n🚀 Demo: Running MCP ClickHouse server with uvx")
     print("=" * 60)
 
     try:
-        from sql2text.example import MCPClickHouseClient
+        from sql2text.example import MCPHost
 
-        print("📦 Creating MCP client...")
-        client = MCPClickHouseClient()
+        # (name, params) for every MCP server the demo talks to; None uses mcp-config.json
+        servers = [("mcp-clickhouse", None)]
 
+        print("📦 Connecting the configured MCP servers through MCPHost...")
         print(
             "🔗 Connecting to ClickHouse via MCP (uvx will download mcp-clickhouse)..."
         )
         print("   This may take a moment on first run as uvx downloads the package...")
 
-        await client.connect()
-
-        print("\n🎉 Success! MCP server is running via uvx")
-        print("   No permanent installation required!")
+        if prewarm is not None:
+            await asyncio.wrap_future(prewarm)
 
-        # Try a simple query
-        print("\n📊 Testing with a simple query...")
+        host = MCPHost()
         try:
-            result = await client.execute_query("SELECT 1 as test_value")
-            print(f"   Query result: {result}")
-        except Exception as e:
-            print(f"   Query test failed: {e}")
+            await host.connect_all(servers)
+            client = host.clients["mcp-clickhouse"]
+
+            print("\n🎉 Success! MCP server is running via uvx")
+            print("   No permanent installation required!")
+
+            # Try a simple query
+            print("\n📊 Testing with a simple query...")
+            try:
+                result = await client.execute_query("SELECT 1 as test_value")
+                print(f"   Query result: {result}")
+            except Exception as e:
+                print(f"   Query test failed: {e}")
+        finally:
+            await host.aclose()
+            # One-shot script: end the pooled transports too, not just the checkout
+            await host.pool.close_all()
 
         print("\n✨ Demo completed successfully!")
         print("   The MCP server was downloaded and run on-demand by uvx")
@@ -69,6 +126,13 @@ async def demo_mcp_with_uvx():
         print("3. Verify ClickHouse server accessibility")
 
 
+def _add_src_to_path():
+    """Make the in-repo `sql2text` package importable."""
+    src = os.path.join(os.path.dirname(__file__), "src")
+    if src not in sys.path:
+        sys.path.insert(0, src)
+
+
 def main():
     """Run the uvx demo."""
     print("🧪 uvx MCP Server Demo")
@@ -78,8 +142,26 @@ def main():
     if not check_uvx():
         return False
 
-    # Run the demo
-    asyncio.run(demo_mcp_with_uvx())
+    # Run the demo on the shared event loop so pooled sessions outlive this call
+    _add_src_to_path()
+    from sql2text._logging import configure_logging
+    from sql2text.async_loop import AsyncLoopThread
+
+    configure_logging()
+
+    loop_thread = AsyncLoopThread.get()
+    # Submitted first, so the uvx download is already running while the demo
+    # imports the client modules
+    uvx_params = _uvx_server_params()
+    prewarm = loop_thread.submit(_prewarm_uvx_cache(uvx_params)) if uvx_params else None
+    future = loop_thread.submit(demo_mcp_with_uvx(prewarm))
+    try:
+        future.result()
+    except KeyboardInterrupt:
+        # Cancel on the loop so the demo's cleanup runs; the atexit hook waits for it
+        future.cancel()
+        print("\n👋 Interrupted")
+        return False
     return True
 
 
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Keep one mcp-clickhouse server running in the background and share it across runs.
+
+Each `example.py` run otherwise spawns `uvx ... mcp-clickhouse` over stdio and pays its
+start-up cost. This starts the configured server once with its HTTP transport on
+localhost; point the examples at it with the printed MCP_URL.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run mcp-clickhouse as a shared local HTTP server"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    cli_args = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+    from sql2text.example import load_mcp_server_params
+
+    params = load_mcp_server_params(server_name="mcp-clickhouse")
+    env = {
+        **os.environ,
+        **(params.env or {}),
+        "CLICKHOUSE_MCP_SERVER_TRANSPORT": "http",
+        "CLICKHOUSE_MCP_BIND_HOST": cli_args.host,
+        "CLICKHOUSE_MCP_BIND_PORT": str(cli_args.port),
+    }
+
+    print("🚀 Starting shared mcp-clickhouse server")
+    print(f"   export MCP_URL=http://{cli_args.host}:{cli_args.port}/mcp")
+    try:
+        sys.exit(subprocess.call([params.command, *params.args], env=env))
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
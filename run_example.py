@@ -6,18 +6,28 @@ This script provides an easy way to execute the example without navigating to th
 
 import sys
 import os
-import asyncio
-
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from sql2text.example import main
+import shutil
 
 if __name__ == "__main__":
     print("🚀 Starting SQL2Text with ClickHouse MCP Server")
     print("=" * 60)
-    
+
+    # The stdio MCP server is launched through uvx; bail out before the heavy imports
+    if shutil.which("uvx") is None and not os.environ.get("MCP_URL"):
+        print("❌ uvx not found. Please install uv (which includes uvx):")
+        print("   curl -LsSf https://astral.sh/uv/install.sh | sh")
+        print("   or set MCP_URL to use a remote MCP server")
+        sys.exit(1)
+
+    # Add the src directory to the Python path
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
     try:
+        import asyncio
+
+        from sql2text.example import main
+
+        # main() blocks on input(); keep it on the main thread so Ctrl-C lands there
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
@@ -33,6 +33,17 @@ else
     echo "   Update uv: curl -LsSf https://astral.sh/uv/install.sh | sh"
 fi
 
+# Install the MCP server once so it starts without uvx resolving it each run
+echo "📦 Installing mcp-clickhouse..."
+if uv tool install --python 3.10 mcp-clickhouse &> /dev/null; then
+    echo "✅ mcp-clickhouse installed - it will be started directly"
+else
+    echo "ℹ️  Could not install mcp-clickhouse - uvx will run it on-demand"
+fi
+
+# Record which modules import cleanly so the setup check can skip probing them
+python build_setup_manifest.py
+
 # Run tests
 echo "🧪 Running setup tests..."
 python test_setup.py
@@ -0,0 +1,25 @@
+"""Console logging for the example entry points."""
+
+import logging
+import os
+import sys
+
+logger = logging.getLogger("sql2text")
+
+
+def configure_logging() -> None:
+    """Print `sql2text` status lines to stdout; safe to call from every entry point.
+
+    The level comes from SQL2TEXT_LOG (e.g. DEBUG); unknown names fall back to INFO.
+    Output goes through one StreamHandler on stdout, which flushes after each record
+    so status lines stay in order with the demos' print() output.
+    """
+    if logger.handlers:
+        return
+    level = logging.getLevelName(os.environ.get("SQL2TEXT_LOG", "INFO").strip().upper())
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(level if isinstance(level, int) else logging.INFO)
+    # Already printed here; don't repeat through any root handler
+    logger.propagate = False
@@ -0,0 +1,58 @@
+"""Locate and parse mcp-config.json; shared by the example clients."""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# orjson is optional; it parses the same bytes several times faster than json
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Resolved once at import rather than on every lookup
+_PROJECT_ROOT_CONFIG = Path(__file__).resolve().parents[2] / "mcp-config.json"
+
+
+def _find_mcp_config_path(explicit_path: Optional[str] = None) -> Optional[str]:
+    """Find the mcp-config.json path.
+
+    Order of precedence:
+    1) explicit path provided
+    2) current working directory
+    3) project root (three parents up from this file)
+    """
+    return _resolve_mcp_config_path(explicit_path, str(Path.cwd()))
+
+
+@lru_cache(maxsize=4)
+def _resolve_mcp_config_path(explicit_path: Optional[str], cwd: str) -> Optional[str]:
+    # Memoized per (explicit path, cwd) so repeated loaders skip the stat calls
+    if explicit_path:
+        p = Path(explicit_path)
+        if p.is_file():
+            return str(p)
+
+    cwd_candidate = Path(cwd) / "mcp-config.json"
+    if cwd_candidate.is_file():
+        return str(cwd_candidate)
+
+    if _PROJECT_ROOT_CONFIG.is_file():
+        return str(_PROJECT_ROOT_CONFIG)
+
+    return None
+
+
+def _load_mcp_config(path: str) -> dict:
+    """Return the parsed config at `path`, re-reading it only when its mtime changes."""
+    return _load_mcp_config_at(path, os.path.getmtime(path))
+
+
+@lru_cache(maxsize=4)
+def _load_mcp_config_at(path: str, mtime: float) -> dict:
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
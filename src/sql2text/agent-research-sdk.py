@@ -1,19 +1,160 @@
 import argparse
 import asyncio
 import base64
+import binascii
+import functools
+import hashlib
 import json
 import os
-import urllib.error
-import urllib.request
+import reprlib
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 
 import deepl
+import requests
 from agents import Agent, ItemHelpers, Runner, function_tool
 from linkup import LinkupClient
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# Resolved once; token streaming is skipped if this openai version lacks it
+try:
+    from openai.types.responses import ResponseTextDeltaEvent
+except ImportError:
+    ResponseTextDeltaEvent = None
+
+
+# Spellings of English accepted for `native_language`
+_ENGLISH_ALIASES = frozenset(
+    {
+        "english",
+        "en",
+        "en-us",
+        "en-gb",
+        "eng",
+        "us english",
+        "american english",
+        "british english",
+    }
+)
+_EN_US_TARGET_ALIASES = frozenset(
+    {"en", "english", "en-us", "american english", "us english"}
+)
+_EN_GB_TARGET_ALIASES = frozenset({"en-gb", "british english"})
+_EN_SOURCE_ALIASES = frozenset(
+    {"en", "en-us", "en-gb", "english", "us english", "british english"}
+)
+_PT_SOURCE_ALIASES = frozenset({"pt", "pt-pt", "pt-br", "portuguese"})
+
+_LINKUP: Optional[LinkupClient] = None
+_DEEPL: Optional[deepl.DeepLClient] = None
+# Tools call the factories from asyncio.to_thread workers, possibly several at once
+_clients_lock = threading.Lock()
+
+
+def _get_linkup() -> LinkupClient:
+    """Return the shared LinkupClient, creating it on first use."""
+    global _LINKUP
+    with _clients_lock:
+        if _LINKUP is None:
+            _LINKUP = LinkupClient(api_key=os.environ["LINKUP_API_KEY"])
+        return _LINKUP
+
+
+def _get_deepl() -> Optional[deepl.DeepLClient]:
+    """Return the shared DeepLClient, or None if DEEPL_AUTH_KEY is not set."""
+    global _DEEPL
+    with _clients_lock:
+        if _DEEPL is None:
+            deepl_key = os.environ.get("DEEPL_AUTH_KEY")
+            if deepl_key:
+                _DEEPL = deepl.DeepLClient(deepl_key)
+        return _DEEPL
+
+
+# On-disk cache of Linkup responses, shared across chat sessions
+_LINKUP_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "sql2text", "linkup.sqlite3"
+)
+_NEWS_CACHE_TTL_SECONDS = 60 * 60
+_SOURCES_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+_linkup_cache_db: Optional[sqlite3.Connection] = None
+_linkup_cache_lock = threading.Lock()
+
+
+def _get_linkup_cache() -> Optional[sqlite3.Connection]:
+    """Open the response cache on first use; returns None if it cannot be created."""
+    global _linkup_cache_db
+    if _linkup_cache_db is None:
+        try:
+            os.makedirs(os.path.dirname(_LINKUP_CACHE_PATH), exist_ok=True)
+            db = sqlite3.connect(_LINKUP_CACHE_PATH, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            # Nothing is served past the longest TTL, so drop it
+            db.execute(
+                "DELETE FROM responses WHERE stored_at < ?",
+                (time.time() - _SOURCES_CACHE_TTL_SECONDS,),
+            )
+            db.commit()
+        except (OSError, sqlite3.Error):
+            return None
+        _linkup_cache_db = db
+    return _linkup_cache_db
+
+
+def _cached_linkup_search(ttl_seconds: float, **search_kwargs: Any) -> dict[str, Any]:
+    """Run `linkup.search(**search_kwargs)` and return its dump, reusing a cached copy.
+
+    Responses are keyed on a SHA-256 of the search arguments and served from disk while
+    younger than `ttl_seconds`, so retries of the same search skip the HTTP call.
+    """
+    key = hashlib.sha256(
+        json.dumps(search_kwargs, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+    with _linkup_cache_lock:
+        db = _get_linkup_cache()
+        row = None
+        if db is not None:
+            try:
+                row = db.execute(
+                    "SELECT payload FROM responses WHERE key = ? AND stored_at >= ?",
+                    (key, time.time() - ttl_seconds),
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+    if row is not None:
+        return json.loads(row[0])
+
+    # The single dump per response; hits and misses both return it parsed back
+    payload = _get_linkup().search(**search_kwargs).model_dump_json()
+    if db is not None:
+        with _linkup_cache_lock:
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, stored_at, payload) VALUES (?, ?, ?)",
+                    (key, time.time(), payload),
+                )
+                db.commit()
+            except sqlite3.Error:
+                pass
+    return json.loads(payload)
 
 
 @function_tool
-def search_web(
+async def search_web(
     query: str,
     depth: Optional[str] = "standard",
     native_language: Optional[str] = None,
@@ -25,25 +166,17 @@ def search_web(
     If `native_language` is provided and is not 'English', the query will be
     biased to only include sources in that language and to exclude English sources.
     """
-    linkup = LinkupClient(api_key=os.environ["LINKUP_API_KEY"])
     # Strengthen the prompt to exclude English sources when a local language is given
     if native_language:
         lang_norm = native_language.strip().lower()
-        is_english = lang_norm in {
-            "english",
-            "en",
-            "en-us",
-            "en-gb",
-            "eng",
-            "us english",
-            "american english",
-            "british english",
-        }
+        is_english = lang_norm in _ENGLISH_ALIASES
     else:
         is_english = False
     if native_language and not is_english:
         query = f"{query}; content in {native_language} only; exclude English sources; do not translate"
-    resp = linkup.search(
+    results = await asyncio.to_thread(
+        _cached_linkup_search,
+        _NEWS_CACHE_TTL_SECONDS,
         query=query,
         depth=depth,
         output_type="searchResults",
@@ -51,27 +184,29 @@ def search_web(
         include_domains=include_domains,
         exclude_domains=exclude_domains,
     )
-    return resp.model_dump()
+    return results
 
 
+@functools.lru_cache(maxsize=64)
 def _normalize_target_lang(lang: str) -> str:
     """Minimal normalization for DeepL target language codes."""
     key = (lang or "").strip().lower()
-    if key in {"en", "english", "en-us", "american english", "us english"}:
+    if key in _EN_US_TARGET_ALIASES:
         return "EN-US"
-    if key in {"en-gb", "british english"}:
+    if key in _EN_GB_TARGET_ALIASES:
         return "EN-GB"
     return (lang or "EN-US").upper()
 
 
+@functools.lru_cache(maxsize=64)
 def _normalize_source_lang(lang: Optional[str]) -> Optional[str]:
     """Minimal normalization for DeepL source language codes (or None for auto-detect)."""
     if not lang:
         return None
     key = lang.strip().lower()
-    if key in {"en", "en-us", "en-gb", "english", "us english", "british english"}:
+    if key in _EN_SOURCE_ALIASES:
         return "EN"
-    if key in {"pt", "pt-pt", "pt-br", "portuguese"}:
+    if key in _PT_SOURCE_ALIASES:
         return "PT"
     # If user passes a long name like 'spanish', fall back to auto-detect to avoid errors
     if len(key) > 3:
@@ -79,8 +214,46 @@ def _normalize_source_lang(lang: Optional[str]) -> Optional[str]:
     return key.upper()
 
 
+# Shared by translate_text and translate_texts, keyed by (text, target_lang)
+_DEEPL_CACHE_MAXSIZE = 2048
+_deepl_cache: "OrderedDict[tuple[str, str], str]" = OrderedDict()
+_deepl_cache_lock = threading.Lock()
+
+
+def _deepl_cache_get(key: tuple[str, str]) -> Optional[str]:
+    """Return a cached translation for `key`, or None."""
+    with _deepl_cache_lock:
+        hit = _deepl_cache.get(key)
+        if hit is not None:
+            _deepl_cache.move_to_end(key)
+        return hit
+
+
+def _deepl_cache_put(key: tuple[str, str], translated: str) -> None:
+    """Store a translation, evicting the oldest beyond `_DEEPL_CACHE_MAXSIZE`."""
+    with _deepl_cache_lock:
+        _deepl_cache[key] = translated
+        _deepl_cache.move_to_end(key)
+        while len(_deepl_cache) > _DEEPL_CACHE_MAXSIZE:
+            _deepl_cache.popitem(last=False)
+
+
+def _deepl_translate_cached(text: str, target_lang: str) -> str:
+    """Translate via DeepL, reusing results for repeated (text, target_lang) pairs.
+
+    Failed calls raise and are therefore not cached.
+    """
+    hit = _deepl_cache_get((text, target_lang))
+    if hit is not None:
+        return hit
+    translated = _get_deepl().translate_text(text, target_lang=target_lang)
+    result = translated.text if hasattr(translated, "text") else str(translated)
+    _deepl_cache_put((text, target_lang), result)
+    return result
+
+
 @function_tool
-def translate_text(
+async def translate_text(
     text: str,
 ) -> dict[str, str]:
     """Translate text to a target language using DeepL.
@@ -89,18 +262,12 @@ def translate_text(
     - lets DeepL auto-detect source-language
     - Returns an error field instead of raising so callers don't crash
     """
-    deepl_key = os.environ.get("DEEPL_AUTH_KEY")
-    if not deepl_key:
+    if _get_deepl() is None:
         return {"error": "DEEPL_AUTH_KEY not set; translation unavailable"}
 
-    client = deepl.DeepLClient(deepl_key)
     try:
-        translated = client.translate_text(
-            text,
-            target_lang="EN-US",
-        )
-        translated_text = (
-            translated.text if hasattr(translated, "text") else str(translated)
+        translated_text = await asyncio.to_thread(
+            _deepl_translate_cached, text, "EN-US"
         )
         return {"translated_text": translated_text}
     except Exception as e:
@@ -108,7 +275,58 @@ def translate_text(
 
 
 @function_tool
-def find_local_sources_by_place(
+async def translate_texts(
+    texts: list[str],
+) -> dict[str, Any]:
+    """Translate several texts to English (EN-US) in a single DeepL request.
+
+    - Prefer this over repeated translate_text calls when there is more than one snippet
+    - Results are returned in the same order as `texts`
+    - Snippets already translated are served from the cache; only the rest are sent
+    - Returns an error field instead of raising so callers don't crash
+    """
+    client = _get_deepl()
+    if client is None:
+        return {"error": "DEEPL_AUTH_KEY not set; translation unavailable"}
+    if not texts:
+        return {"translated": []}
+
+    translated = {text: _deepl_cache_get((text, "EN-US")) for text in texts}
+    misses = [text for text, hit in translated.items() if hit is None]
+    try:
+        if misses:
+            results = await asyncio.to_thread(
+                client.translate_text, misses, target_lang="EN-US"
+            )
+            for text, r in zip(misses, results):
+                translated[text] = r.text if hasattr(r, "text") else str(r)
+                _deepl_cache_put((text, "EN-US"), translated[text])
+        return {"translated": [translated[text] for text in texts]}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _collect_urls(obj: Any, limit: int) -> list[str]:
+    """Collect up to `limit` unique `url` strings from nested dicts/lists in document order.
+
+    Walks the structure with an explicit stack and stops as soon as `limit` is reached.
+    """
+    # Insertion-ordered dict doubles as the dedup set and the result list
+    urls: dict[str, None] = {}
+    stack: list[tuple[Optional[str], Any]] = [(None, obj)]
+    while stack and len(urls) < limit:
+        key, value = stack.pop()
+        if key is not None and key.lower() == "url" and isinstance(value, str):
+            urls.setdefault(value)
+        elif isinstance(value, dict):
+            stack.extend(reversed(value.items()))
+        elif isinstance(value, list):
+            stack.extend((None, element) for element in reversed(value))
+    return list(urls)
+
+
+@function_tool
+async def find_local_sources_by_place(
     place: str,
     native_language: str,
     top_n: int = 10,
@@ -120,18 +338,8 @@ def find_local_sources_by_place(
     Enforces local-language sources by explicitly excluding English content when
     the native language is not English.
     """
-    linkup = LinkupClient(api_key=os.environ["LINKUP_API_KEY"])
     lang_norm = native_language.strip().lower()
-    is_english = lang_norm in {
-        "english",
-        "en",
-        "en-us",
-        "en-gb",
-        "eng",
-        "us english",
-        "american english",
-        "british english",
-    }
+    is_english = lang_norm in _ENGLISH_ALIASES
     if is_english:
         q = (
             f"local news websites for {place} in {native_language}; "
@@ -143,7 +351,9 @@ def find_local_sources_by_place(
             f"official newspaper, tv, radio sites; sources in {native_language} only; "
             f"exclude English sources; do not translate"
         )
-    resp = linkup.search(
+    results = await asyncio.to_thread(
+        _cached_linkup_search,
+        _SOURCES_CACHE_TTL_SECONDS,
         query=q,
         depth="standard",
         output_type="searchResults",
@@ -152,36 +362,16 @@ def find_local_sources_by_place(
         exclude_domains=exclude_domains,
     )
 
-    def extract_urls(obj: Any) -> list[str]:
-        urls = []
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                if k.lower() == "url" and isinstance(v, str):
-                    urls.append(v)
-                else:
-                    urls.extend(extract_urls(v))
-        elif isinstance(obj, list):
-            for x in obj:
-                urls.extend(extract_urls(x))
-        return urls
-
-    raw = resp.model_dump()
-    all_urls = extract_urls(raw)
-    seen = set()
-    deduped = []
-    for u in all_urls:
-        if u not in seen:
-            seen.add(u)
-            deduped.append(u)
+    sites = _collect_urls(results, top_n)
     return {
         "place": place,
         "native_language": native_language,
-        "sites": deduped[:top_n],
+        "sites": sites,
     }
 
 
 @function_tool
-def search_local_news(
+async def search_local_news(
     place: str,
     native_language: str,
     sites: Optional[list[str]] = None,
@@ -193,22 +383,11 @@ def search_local_news(
 
     Excludes English sources when the native language is not English.
     """
-    linkup = LinkupClient(api_key=os.environ["LINKUP_API_KEY"])
     site_filter = ""
     if sites:
-        site_terms = [f"site:{s}" for s in sites[:10]]
-        site_filter = "(" + " OR ".join(site_terms) + ") "
+        site_filter = "(" + " OR ".join(f"site:{s}" for s in sites[:10]) + ") "
     lang_norm = native_language.strip().lower()
-    is_english = lang_norm in {
-        "english",
-        "en",
-        "en-us",
-        "en-gb",
-        "eng",
-        "us english",
-        "american english",
-        "british english",
-    }
+    is_english = lang_norm in _ENGLISH_ALIASES
     if is_english:
         q = (
             f"{site_filter}{place} local news in {native_language} last {since_days} days; "
@@ -219,7 +398,9 @@ def search_local_news(
             f"{site_filter}{place} local news in {native_language} last {since_days} days; "
             f"content in {native_language} only; exclude English sources; do not translate"
         )
-    resp = linkup.search(
+    results = await asyncio.to_thread(
+        _cached_linkup_search,
+        _NEWS_CACHE_TTL_SECONDS,
         query=q,
         depth="deep",
         output_type="searchResults",
@@ -227,7 +408,7 @@ def search_local_news(
         include_domains=include_domains,
         exclude_domains=exclude_domains,
     )
-    return resp.model_dump()
+    return results
 
 
 # ------------------------------
@@ -235,6 +416,16 @@ def search_local_news(
 # ------------------------------
 
 
+# Directories already created by this process, so repeated saves skip the makedirs stat
+_DIRS_SEEN: set[str] = set()
+
+
+def _ensure_dir(directory: str) -> None:
+    if directory not in _DIRS_SEEN:
+        os.makedirs(directory, exist_ok=True)
+        _DIRS_SEEN.add(directory)
+
+
 @function_tool
 def save_to_file(
     path: str,
@@ -251,10 +442,10 @@ def save_to_file(
     - `encoding`: Text encoding to use
     - `ensure_directory`: Create parent directory if it does not exist
     """
+    directory = os.path.dirname(path)
     try:
-        directory = os.path.dirname(path)
         if ensure_directory and directory:
-            os.makedirs(directory, exist_ok=True)
+            _ensure_dir(directory)
         mode = "a" if append else "w"
         with open(path, mode, encoding=encoding) as f:
             bytes_written = f.write(content)
@@ -266,6 +457,8 @@ def save_to_file(
             "encoding": encoding,
         }
     except Exception as e:
+        # The directory may have been removed since it was created; check again next time
+        _DIRS_SEEN.discard(directory)
         return {"status": "error", "path": path, "error": str(e)}
 
 
@@ -273,6 +466,50 @@ def save_to_file(
 # Image Generation: Freepik Text-to-Image
 # ------------------------------
 
+FREEPIK_TEXT_TO_IMAGE_URL = "https://api.freepik.com/v1/ai/text-to-image"
+
+# orjson is optional; it parses large base64 image payloads noticeably faster
+if orjson is not None:
+    _json_dumps_bytes = orjson.dumps
+    _json_loads = orjson.loads
+else:
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+# Shared session so repeated generations reuse the keep-alive TLS connection
+_FREEPIK_SESSION = requests.Session()
+_FREEPIK_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+# Multiple of 4 so each slice of a base64 string decodes on its own
+_BASE64_CHUNK_CHARS = 4 * 64 * 1024
+
+
+def _write_base64_file(path: str, b64: str) -> None:
+    """Decode `b64` into `path` chunk by chunk instead of materializing the whole image.
+
+    Falls back to a one-shot decode for input with embedded whitespace; removes the
+    partial file and re-raises if the data is not valid base64.
+    """
+    try:
+        with open(path, "wb") as fh:
+            try:
+                for start in range(0, len(b64), _BASE64_CHUNK_CHARS):
+                    fh.write(
+                        binascii.a2b_base64(b64[start : start + _BASE64_CHUNK_CHARS])
+                    )
+            except binascii.Error:
+                fh.seek(0)
+                fh.truncate()
+                fh.write(base64.b64decode(b64))
+    except Exception:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
 
 @function_tool
 def freepik_text_to_image(
@@ -324,44 +561,38 @@ def freepik_text_to_image(
     if style:
         payload["styling"] = {"style": style}
 
-    headers = {
-        "Content-Type": "application/json",
-        "x-freepik-api-key": api_key,
-    }
-
-    req = urllib.request.Request(
-        url="https://api.freepik.com/v1/ai/text-to-image",
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
-
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            status_code = resp.getcode()
-            body = resp.read().decode("utf-8")
-    except urllib.error.HTTPError as e:
-        try:
-            err_body = e.read().decode("utf-8")
-        except Exception:
-            err_body = str(e)
+        resp = _FREEPIK_SESSION.post(
+            FREEPIK_TEXT_TO_IMAGE_URL,
+            data=_json_dumps_bytes(payload),
+            headers={
+                "Content-Type": "application/json",
+                "x-freepik-api-key": api_key,
+            },
+            timeout=60,
+        )
+        status_code = resp.status_code
+        resp.raise_for_status()
+        body = resp.content
+    except requests.HTTPError as e:
+        err_body = e.response.text if e.response is not None else ""
         return {
             "status": "error",
-            "http_status": getattr(e, "code", None),
+            "http_status": getattr(e.response, "status_code", None),
             "error": err_body or str(e),
         }
-    except urllib.error.URLError as e:
-        return {"status": "error", "error": getattr(e, "reason", str(e))}
+    except requests.RequestException as e:
+        return {"status": "error", "error": str(e)}
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
     try:
-        data = json.loads(body)
+        data = _json_loads(body)
     except Exception as e:
         return {
             "status": "error",
             "error": f"Invalid JSON from Freepik: {e}",
-            "raw": body,
+            "raw": body.decode("utf-8", "replace"),
         }
 
     images = data.get("data", []) if isinstance(data, dict) else []
@@ -369,23 +600,18 @@ def freepik_text_to_image(
 
     saved_paths: list[str] = []
     if save_dir:
-        os.makedirs(save_dir, exist_ok=True)
+        _ensure_dir(save_dir)
         prefix = filename_prefix or "freepik"
         for idx, item in enumerate(images):
             b64 = item.get("base64") if isinstance(item, dict) else None
             if not b64:
                 continue
-            try:
-                img_bytes = base64.b64decode(b64)
-            except Exception:
-                continue
             out_path = os.path.join(save_dir, f"{prefix}_{idx + 1}.png")
             try:
-                with open(out_path, "wb") as fh:
-                    fh.write(img_bytes)
+                _write_base64_file(out_path, b64)
                 saved_paths.append(out_path)
             except Exception:
-                # Skip saving on error but still return others
+                # Skip saving on error (including invalid base64) but still return others
                 continue
 
     return {
@@ -402,6 +628,20 @@ def freepik_text_to_image(
 # Streaming Functions
 # ------------------------------
 
+# Bounded repr for tool outputs; avoids stringifying whole Linkup payloads just to show a preview
+_PREVIEW_REPR = reprlib.Repr(
+    maxlevel=3, maxdict=8, maxlist=8, maxstring=160, maxother=160
+)
+_PREVIEW_LIMIT = 150
+
+
+def _preview(value: Any) -> str:
+    """Return at most `_PREVIEW_LIMIT` characters describing a tool output."""
+    text = value if isinstance(value, str) else _PREVIEW_REPR.repr(value)
+    if len(text) > _PREVIEW_LIMIT:
+        return text[:_PREVIEW_LIMIT] + "..."
+    return text
+
 
 async def run_agent_with_streaming(
     agent: Agent,
@@ -423,31 +663,44 @@ async def run_agent_with_streaming(
         agent, input=input_text, previous_response_id=previous_response_id
     )
 
+    # Bound once; the token path below runs for every streamed delta
+    _write = sys.stdout.write
+    _flush = sys.stdout.flush
+
     print("🤖 Agent is thinking...")
     final_output = ""
     last_response_id = None
     tool_count = 0
     response_buffer = ""
+    # Streamed tokens not yet written to stdout; flushed in batches to cut write syscalls
+    pending_output = ""
     is_streaming_response = False
     tool_call_names: dict[str, str] = {}
 
     async for event in result.stream_events():
+        # Write out buffered tokens before any other status line so ordering is preserved
+        if pending_output and event.type != "raw_response_event":
+            _write(pending_output)
+            _flush()
+            pending_output = ""
+
         # Handle raw response events (token-by-token streaming)
         if event.type == "raw_response_event":
-            if stream_tokens:
-                # Import here to avoid issues if not available
-                try:
-                    from openai.types.responses import ResponseTextDeltaEvent
-
-                    if isinstance(event.data, ResponseTextDeltaEvent):
-                        if not is_streaming_response:
-                            print("\n💭 Generating response:")
-                            is_streaming_response = True
-                        delta = event.data.delta
-                        response_buffer += delta
-                        print(delta, end="", flush=True)
-                except ImportError:
-                    pass
+            if (
+                stream_tokens
+                and ResponseTextDeltaEvent is not None
+                and isinstance(event.data, ResponseTextDeltaEvent)
+            ):
+                if not is_streaming_response:
+                    _write("\n💭 Generating response:\n")
+                    is_streaming_response = True
+                delta = event.data.delta
+                response_buffer += delta
+                pending_output += delta
+                if len(pending_output) >= 64 or "\n" in delta:
+                    _write(pending_output)
+                    _flush()
+                    pending_output = ""
             continue
 
         # Handle agent updates (when agent changes due to handoffs)
@@ -474,12 +727,15 @@ async def run_agent_with_streaming(
                         raw_call, "id", None
                     )
 
-                    # If pydantic model, try model_dump()
-                    if hasattr(raw_call, "model_dump") and callable(
+                    # If pydantic model, try model_dump() (only when something is missing)
+                    model_dump = (
                         getattr(raw_call, "model_dump", None)
-                    ):
+                        if tool_name is None or call_id is None
+                        else None
+                    )
+                    if callable(model_dump):
                         try:
-                            dumped = raw_call.model_dump(exclude_unset=True)
+                            dumped = model_dump(exclude_unset=True)
                             tool_name = (
                                 tool_name
                                 or dumped.get("name")
@@ -542,9 +798,7 @@ async def run_agent_with_streaming(
                         call_id_out = raw_out.get("call_id")
                 tool_label = tool_call_names.get(str(call_id_out), "unknown")
 
-                output = str(event.item.output)
-                if len(output) > 150:
-                    output = output[:150] + "..."
+                output = _preview(event.item.output)
                 print(f"✅ Tool completed: {tool_label}: {output}")
 
             elif event.item.type == "message_output_item":
@@ -559,6 +813,10 @@ async def run_agent_with_streaming(
                 # Handle other event types if needed
                 pass
 
+    if pending_output:
+        _write(pending_output)
+        _flush()
+
     # Try to get the last response ID from the result
     try:
         last_response_id = result.last_response_id
@@ -601,6 +859,7 @@ def main() -> None:
         tools=[
             search_web,
             translate_text,
+            translate_texts,
             find_local_sources_by_place,
             search_local_news,
             save_to_file,
@@ -613,7 +872,7 @@ def main() -> None:
             "When the native language is not English, ONLY use sources in that native language and EXCLUDE English sources. "
             "In such cases, call find_local_sources_by_place, then call search_local_news using include_domains derived from those sites. "
             "Also issue a complementary search_web query with native_language and aligned include_domains/exclude_domains to broaden local-language coverage; merge and deduplicate results before synthesis. "
-            "Execution strategy: Prefer calling independent tools in parallel rather than serially. For example, run find_local_sources_by_place and a complementary search_web at the same time; when sites are already known, run search_local_news and search_web concurrently. Batch multiple translate_text calls concurrently where safe. Cap concurrency to ~3–5 to avoid rate limits. Only serialize dependent retries (e.g., the tighten-and-retry exclusion loop). "
+            "Execution strategy: Prefer calling independent tools in parallel rather than serially. For example, run find_local_sources_by_place and a complementary search_web at the same time; when sites are already known, run search_local_news and search_web concurrently. When several snippets need translation, send them together in one translate_texts call instead of separate translate_text calls. Cap concurrency to ~3–5 to avoid rate limits. Only serialize dependent retries (e.g., the tighten-and-retry exclusion loop). "
             "Tool budgeting: Aim to use fewer than 15 total tool calls per request. Scale searches with complexity: simple fact lookup (2–4 calls), moderate topical query (4–8), multi-faceted or regional news synthesis (8–12). If you estimate needing >12, prioritize the highest-signal sources first, and propose narrowing scope rather than exceeding the budget. "
             "Use domain filters to keep results local: (1) pass include_domains with hostnames of local outlets discovered via find_local_sources_by_place (prefer hosts under the region's ccTLD, e.g., 'example.in' for India); tighten this list if results are still global or English‑heavy. (2) pass exclude_domains to suppress generic/global sites such as 'wikipedia.org', 'britannica.com', 'quora.com', 'medium.com', 'youtube.com', 'pinterest.com' unless specifically relevant. Re‑run searches with adjusted filters if results drift from the local focus. "
             "Iteration policy for non-English workflows: Whenever any English result appears while native_language is not English, immediately add the offending hostnames to exclude_domains and rerun the same search; tighten include_domains toward native outlets (prefer ccTLD) as needed. Repeat this tighten-and-retry loop at most 4 times, stopping early once results are predominantly in the native language. "
@@ -621,6 +880,7 @@ def main() -> None:
             "For each news item, provide a short 2-4 sentence blurb rather than just links. "
             "Translation policy: When a source or excerpt is not in English, you MUST call the translate_text tool to produce English text. "
             "Specifically: (1) For every quoted snippet and each per-item blurb derived from a non-English article, call translate_text with source_lang set to the detected language and target_lang='EN-US'. "
+            "When translating more than one snippet at a time, pass them all to translate_texts in a single call. "
             "(2) Do not perform your own translation for these; prefer translate_text. If translate_text fails or is unavailable (e.g., DEEPL not configured), you may translate inline and annotate '[translated inline]'. "
             "(3) Deliver the final synthesized answer in English. If you reuse any non-English sentences verbatim, translate them via translate_text and annotate '[translated from <Language>]'. "
             "A running chat transcript is provided in context under 'chat_history'; use it to preserve continuity."
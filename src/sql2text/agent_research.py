@@ -1,11 +1,22 @@
 import argparse
+import asyncio
 import json
 import os
-from typing import Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterator, Optional, Union
 
 import deepl
 from agents import Agent, Runner
 from linkup import LinkupClient
+from openai import OpenAI
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 
 def create_tools_schema() -> list[dict[str, Any]]:
@@ -122,32 +133,523 @@ def create_tools_schema() -> list[dict[str, Any]]:
     ]
 
 
-def run_research(
-    topic_or_query: str,
-    depth: str = "standard",
-    source_translation_lang: Optional[str] = None,
-    output_translation_lang: Optional[str] = None,
+# The schema has no inputs, so build it once instead of on every research turn
+_TOOLS_SCHEMA = create_tools_schema()
+
+
+# Clients are shared across run_research calls (and chat prompts) so their HTTP
+# connection pools stay warm
+_OPENAI: Optional[OpenAI] = None
+_LINKUP: Optional[LinkupClient] = None
+_DEEPL: Optional[deepl.DeepLClient] = None
+
+
+def _get_openai() -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use."""
+    global _OPENAI
+    if _OPENAI is None:
+        _OPENAI = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+    return _OPENAI
+
+
+def _get_linkup() -> LinkupClient:
+    """Return the shared LinkupClient, creating it on first use."""
+    global _LINKUP
+    if _LINKUP is None:
+        _LINKUP = LinkupClient(api_key=os.environ["LINKUP_API_KEY"])
+    return _LINKUP
+
+
+def _get_deepl() -> Optional[deepl.DeepLClient]:
+    """Return the shared DeepLClient, or None if DEEPL_AUTH_KEY is not set."""
+    global _DEEPL
+    if _DEEPL is None:
+        deepl_key = os.environ.get("DEEPL_AUTH_KEY")
+        if deepl_key:
+            _DEEPL = deepl.DeepLClient(deepl_key)
+    return _DEEPL
+
+
+# Linkup responses are reused for a short while; news goes stale quickly
+_LINKUP_CACHE_TTL_SECONDS = 10 * 60
+_LINKUP_CACHE_MAXSIZE = 256
+_linkup_cache: "OrderedDict[tuple[Any, ...], tuple[float, Any]]" = OrderedDict()
+_linkup_cache_lock = threading.Lock()
+
+
+def _cached_linkup_search(query: str, depth: str) -> Any:
+    """Run a Linkup `searchResults` search and return the response, reusing recent ones.
+
+    The pydantic response is kept as-is so callers can serialize it straight to JSON
+    with `model_dump_json()`, and only dump to a dict when they need to inspect it.
+
+    Entries expire after `_LINKUP_CACHE_TTL_SECONDS`; the oldest are evicted beyond
+    `_LINKUP_CACHE_MAXSIZE`. Failed searches raise and are not cached.
+    """
+    key = (query.strip(), depth)
+    now = time.monotonic()
+    with _linkup_cache_lock:
+        hit = _linkup_cache.get(key)
+        if hit is not None and now - hit[0] < _LINKUP_CACHE_TTL_SECONDS:
+            _linkup_cache.move_to_end(key)
+            return hit[1]
+
+    response = _get_linkup().search(
+        query=query,
+        depth=depth,
+        output_type="searchResults",
+        include_images=False,
+    )
+    with _linkup_cache_lock:
+        _linkup_cache[key] = (now, response)
+        _linkup_cache.move_to_end(key)
+        while len(_linkup_cache) > _LINKUP_CACHE_MAXSIZE:
+            _linkup_cache.popitem(last=False)
+    return response
+
+
+def _extract_deepl_text(
+    result: Union[deepl.TextResult, list[deepl.TextResult]],
+) -> Union[str, list[str]]:
+    """Return the text of a DeepL result, or the texts of a batched list of them."""
+    if isinstance(result, list):
+        return [r.text for r in result]
+    return result.text
+
+
+# Shared by single and batched translations, keyed by (text, target, source, formality)
+_DEEPL_CACHE_MAXSIZE = 256
+_deepl_cache: "OrderedDict[tuple[Any, ...], str]" = OrderedDict()
+_deepl_cache_lock = threading.Lock()
+
+
+def _deepl_cache_get(key: tuple[Any, ...]) -> Optional[str]:
+    """Return a cached translation for `key`, or None."""
+    with _deepl_cache_lock:
+        hit = _deepl_cache.get(key)
+        if hit is not None:
+            _deepl_cache.move_to_end(key)
+        return hit
+
+
+def _deepl_cache_put(key: tuple[Any, ...], translated: str) -> None:
+    """Store a translation, evicting the oldest beyond `_DEEPL_CACHE_MAXSIZE`."""
+    with _deepl_cache_lock:
+        _deepl_cache[key] = translated
+        _deepl_cache.move_to_end(key)
+        while len(_deepl_cache) > _DEEPL_CACHE_MAXSIZE:
+            _deepl_cache.popitem(last=False)
+
+
+def _cached_deepl_translate(
+    text: str,
+    target_lang: str,
+    source_lang: Optional[str],
+    formality: Optional[str],
 ) -> str:
-    """Minimal-input research flow using tool-calling.
+    """Translate via DeepL, reusing results for repeated arguments.
 
-    The model will call `search_web` to gather sources and `translate_text` when needed.
-    If `output_translation_lang` is provided, the final answer should be in that language,
-    and the model may call `translate_text` to produce it.
+    Failed calls raise and are therefore not cached.
     """
-    openai_key = os.environ.get("OPENAI_API_KEY")
-    linkup_key = os.environ.get("LINKUP_API_KEY")
-    if not openai_key:
-        raise RuntimeError("OPENAI_API_KEY is required")
-    if not linkup_key:
-        raise RuntimeError("LINKUP_API_KEY is required")
+    key = (text, target_lang, source_lang, formality)
+    hit = _deepl_cache_get(key)
+    if hit is not None:
+        return hit
+    translated = _extract_deepl_text(
+        _get_deepl().translate_text(
+            text,
+            target_lang=target_lang,
+            source_lang=source_lang,
+            formality=formality,
+        )
+    )
+    _deepl_cache_put(key, translated)
+    return translated
+
+
+# orjson is optional; tool arguments and outputs are parsed/encoded on every call
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
+# Fallback call ids used when the model omits one, per tool
+_DEFAULT_CALL_IDS = {
+    "search_web": "search_web_call",
+    "translate_text": "translate_text_call",
+    "find_local_sources_by_place": "find_local_sources_call",
+    "search_local_news": "search_local_news_call",
+}
+
+
+class _ResearchSession:
+    """Per-request defaults and state shared by the tool handlers of one run."""
+
+    def __init__(
+        self,
+        topic_or_query: str,
+        depth: str,
+        output_translation_lang: Optional[str],
+    ):
+        self.topic_or_query = topic_or_query
+        self.depth = depth
+        self.output_translation_lang = output_translation_lang
+        self.deepl_used = False
+
+
+async def _search_web(args: dict[str, Any], session: _ResearchSession) -> str:
+    q = args.get("query") or session.topic_or_query
+    req_depth = args.get("depth") or session.depth
+    linkup_response = await asyncio.to_thread(_cached_linkup_search, q, req_depth)
+    return linkup_response.model_dump_json()
+
+
+def _needs_translation(text: str, target_lang: str, source_lang: Optional[str]) -> bool:
+    """False when DeepL would hand `text` back unchanged (blank or same language)."""
+    if not text.strip():
+        return False
+    if source_lang and target_lang:
+        # Targets may carry a region ("EN-US") that source codes never do
+        return source_lang.split("-")[0].upper() != target_lang.split("-")[0].upper()
+    return True
+
+
+async def _translate_text(args: dict[str, Any], session: _ResearchSession) -> str:
+    text = args.get("text", "")
+    target_lang = args.get("target_lang", session.output_translation_lang or "EN")
+    source_lang = args.get("source_lang")
+    formality = args.get("formality")
+    if not _needs_translation(text, target_lang, source_lang):
+        return _json_dumps({"translated_text": text})
+    if _get_deepl() is None:
+        return _json_dumps(
+            {
+                "error": "DEEPL_AUTH_KEY not set; translation unavailable",
+            }
+        )
+    translated_text = await asyncio.to_thread(
+        _cached_deepl_translate, text, target_lang, source_lang, formality
+    )
+    session.deepl_used = True
+    return _json_dumps({"translated_text": translated_text})
+
+
+def _iter_urls(obj: Any) -> Iterator[str]:
+    """Yield every string under a `url` key in a nested dict/list dump, iteratively."""
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, dict):
+            # Reversed so the pops below visit children in document order
+            for key, value in reversed(x.items()):
+                if key.lower() == "url" and isinstance(value, str):
+                    yield value
+                else:
+                    stack.append(value)
+        elif isinstance(x, list):
+            stack.extend(reversed(x))
+
+
+async def _find_local_sources_by_place(
+    args: dict[str, Any], session: _ResearchSession
+) -> str:
+    place = args.get("place") or session.topic_or_query
+    native_language = args.get("native_language")
+    top_n = args.get("top_n") or 10
+    if not place:
+        return _json_dumps({"error": "place is required"})
+    if not native_language:
+        return _json_dumps({"error": "native_language is required"})
+
+    language_phrase = f" in {native_language}"
+    q2 = (
+        f"local news websites for {place}{language_phrase}; "
+        f"official newspaper, tv, radio sites; "
+        f"sources in {native_language} only; do not translate"
+    )
+    linkup_response = await asyncio.to_thread(_cached_linkup_search, q2, "standard")
+    # URL extraction needs the dict form; the other searches go straight to JSON
+    raw_dump = linkup_response.model_dump()
+
+    # Insertion-ordered dict keeps the first occurrence of each URL
+    sites = list(dict.fromkeys(_iter_urls(raw_dump)))[: int(top_n)]
+
+    output_payload = {
+        "place": place,
+        "native_language": native_language,
+        "sites": sites,
+    }
+    return _json_dumps(output_payload)
+
+
+async def _search_local_news(args: dict[str, Any], session: _ResearchSession) -> str:
+    place = args.get("place") or session.topic_or_query
+    sites = args.get("sites") or []
+    native_language = args.get("native_language")
+    since_days = int(args.get("since_days") or 7)
+    if not place:
+        return _json_dumps({"error": "place is required"})
+    if not native_language:
+        return _json_dumps({"error": "native_language is required"})
+
+    site_filter = (
+        f"({' OR '.join(f'site:{s}' for s in sites[:10])}) "
+        if isinstance(sites, list) and sites
+        else ""
+    )
+    language_phrase = f" in {native_language}"
+    q3 = (
+        f"{site_filter}{place} local news{language_phrase} last {since_days} days; "
+        f"content in {native_language} only; do not translate"
+    )
+    linkup_response = await asyncio.to_thread(_cached_linkup_search, q3, "standard")
+    return linkup_response.model_dump_json()
+
+
+_TOOL_HANDLERS = {
+    "search_web": _search_web,
+    "translate_text": _translate_text,
+    "find_local_sources_by_place": _find_local_sources_by_place,
+    "search_local_news": _search_local_news,
+}
+
 
-    openai_client = OpenAI(api_key=openai_key)
-    linkup_client = LinkupClient(api_key=linkup_key)
-    deepl_key = os.environ.get("DEEPL_AUTH_KEY")
-    deepl_client = deepl.DeepLClient(deepl_key) if deepl_key else None
+async def _handle_call(item: Any, session: _ResearchSession) -> dict[str, Any]:
+    """Run one function_call item and build its function_call_output entry.
+
+    Errors are reported back to the model as `{"error": ...}` instead of raising, so
+    one failing tool does not cancel the others dispatched in the same turn.
+    """
+    name = getattr(item, "name", None)
+    call_id = getattr(item, "call_id", _DEFAULT_CALL_IDS.get(name, f"{name}_call"))
+    handler = _TOOL_HANDLERS.get(name)
+    try:
+        if handler is None:
+            output = _json_dumps({"error": f"Unknown tool: {name}"})
+        else:
+            args = _json_loads(getattr(item, "arguments", "{}"))
+            output = await handler(args, session)
+    except Exception as e:
+        output = _json_dumps({"error": str(e)})
+    return {
+        "type": "function_call_output",
+        "call_id": call_id,
+        "output": output,
+    }
+
+
+def _translate_key(
+    item: Any, session: _ResearchSession
+) -> Optional[tuple[str, Optional[str], Optional[str]]]:
+    """Return the DeepL options a translate_text call would use, else None."""
+    if getattr(item, "name", None) != "translate_text":
+        return None
+    try:
+        args = _json_loads(getattr(item, "arguments", "{}"))
+    except ValueError:
+        return None
+    target_lang = args.get("target_lang", session.output_translation_lang or "EN")
+    source_lang = args.get("source_lang")
+    if not _needs_translation(args.get("text", ""), target_lang, source_lang):
+        # Answered locally by _translate_text without a DeepL request
+        return None
+    return (target_lang, source_lang, args.get("formality"))
+
+
+async def _translate_batch(
+    items: list[Any],
+    options: tuple[str, Optional[str], Optional[str]],
+    session: _ResearchSession,
+) -> list[dict[str, Any]]:
+    """Translate several translate_text calls sharing `options` in one DeepL request.
+
+    Texts already in the DeepL cache are answered from it; only the misses are sent,
+    and their results are stored back.
+    """
+    texts = [
+        _json_loads(getattr(item, "arguments", "{}")).get("text", "") for item in items
+    ]
+    translated = {text: _deepl_cache_get((text, *options)) for text in texts}
+    misses = [text for text, hit in translated.items() if hit is None]
+    try:
+        if misses:
+            target_lang, source_lang, formality = options
+            results = await asyncio.to_thread(
+                _get_deepl().translate_text,
+                misses,
+                target_lang=target_lang,
+                source_lang=source_lang,
+                formality=formality,
+            )
+            for text, result in zip(misses, _extract_deepl_text(results)):
+                _deepl_cache_put((text, *options), result)
+                translated[text] = result
+        session.deepl_used = True
+        outputs = [_json_dumps({"translated_text": translated[text]}) for text in texts]
+    except Exception as e:
+        outputs = [_json_dumps({"error": str(e)})] * len(items)
+    return [
+        {
+            "type": "function_call_output",
+            "call_id": getattr(item, "call_id", _DEFAULT_CALL_IDS["translate_text"]),
+            "output": output,
+        }
+        for item, output in zip(items, outputs)
+    ]
+
+
+def _call_key(item: Any) -> tuple[Optional[str], str]:
+    """Identify a function_call by tool name and canonical (key-sorted) arguments."""
+    arguments = getattr(item, "arguments", "{}")
+    try:
+        arguments = json.dumps(_json_loads(arguments), sort_keys=True)
+    except (TypeError, ValueError):
+        pass
+    return (getattr(item, "name", None), arguments)
+
+
+def _reuse_output(output: dict[str, Any], item: Any) -> dict[str, Any]:
+    """Address a (possibly shared) function_call_output to `item`'s call id."""
+    name = getattr(item, "name", None)
+    call_id = getattr(item, "call_id", _DEFAULT_CALL_IDS.get(name, f"{name}_call"))
+    return {**output, "call_id": call_id}
+
+
+async def _dispatch_calls(
+    calls: list[Any], session: _ResearchSession
+) -> list[dict[str, Any]]:
+    """Run the function_call items of one response and return their outputs in order.
+
+    Calls repeating an earlier one's tool and arguments are run once and share its
+    output. Independent calls run concurrently, and translate_text calls that share
+    target/source language and formality go to DeepL as a single batched request.
+    """
+    first_index: dict[tuple[Optional[str], str], int] = {}
+    unique: list[Any] = []
+    positions: list[int] = []
+    for item in calls:
+        key = _call_key(item)
+        if key not in first_index:
+            first_index[key] = len(unique)
+            unique.append(item)
+        positions.append(first_index[key])
+
+    unique_outputs = await _dispatch_unique_calls(unique, session)
+    return [
+        _reuse_output(unique_outputs[position], item)
+        for item, position in zip(calls, positions)
+    ]
 
-    tools = create_tools_schema()
 
+async def _dispatch_unique_calls(
+    calls: list[Any], session: _ResearchSession
+) -> list[dict[str, Any]]:
+    groups: dict[tuple[str, Optional[str], Optional[str]], list[int]] = {}
+    if _get_deepl() is not None:
+        for index, item in enumerate(calls):
+            options = _translate_key(item, session)
+            if options is not None:
+                groups.setdefault(options, []).append(index)
+    batches = {
+        options: indexes for options, indexes in groups.items() if len(indexes) > 1
+    }
+    batched = {index for indexes in batches.values() for index in indexes}
+
+    singles = [index for index in range(len(calls)) if index not in batched]
+    results = await asyncio.gather(
+        *(_handle_call(calls[index], session) for index in singles),
+        *(
+            _translate_batch([calls[index] for index in indexes], options, session)
+            for options, indexes in batches.items()
+        ),
+    )
+
+    outputs: list[Optional[dict[str, Any]]] = [None] * len(calls)
+    for index, output in zip(singles, results):
+        outputs[index] = output
+    for indexes, group_outputs in zip(batches.values(), results[len(singles) :]):
+        for index, output in zip(indexes, group_outputs):
+            outputs[index] = output
+    return outputs
+
+
+def _has_final_answer(output: list[Any]) -> bool:
+    """True if a non-empty text message follows the last function_call in `output`.
+
+    Text before the tool calls is a preamble; text after them is the model's answer,
+    so another round-trip just to read the tool outputs would be wasted.
+    """
+    answered = False
+    for item in output:
+        item_type = getattr(item, "type", None)
+        if item_type == "function_call":
+            answered = False
+        elif item_type == "message":
+            answered = answered or any(
+                getattr(part, "text", "").strip()
+                for part in getattr(item, "content", None) or []
+            )
+    return answered
+
+
+# Stream events that carry the finished response object
+_FINAL_RESPONSE_EVENTS = frozenset(
+    {"response.completed", "response.incomplete", "response.failed"}
+)
+_STREAM_END = object()
+
+
+async def _stream_response_events(
+    openai_client: OpenAI, tools: list[dict[str, Any]], input_list: list[Any]
+) -> AsyncIterator[Any]:
+    """Yield Responses API stream events as they arrive.
+
+    The synchronous stream is consumed in a worker thread and handed over through a
+    queue, so the event loop can run tool calls while the model is still generating.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+
+    def pump() -> None:
+        try:
+            stream = openai_client.responses.create(
+                model="gpt-5-nano",
+                tools=tools,
+                input=input_list,
+                stream=True,
+            )
+            with stream:
+                for event in stream:
+                    loop.call_soon_threadsafe(queue.put_nowait, event)
+        except BaseException as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+
+    reader = asyncio.create_task(asyncio.to_thread(pump))
+    try:
+        while True:
+            event = await queue.get()
+            if event is _STREAM_END:
+                break
+            if isinstance(event, BaseException):
+                raise event
+            yield event
+    finally:
+        await reader
+
+
+@lru_cache(maxsize=8)
+def _system_prompt(
+    source_translation_lang: Optional[str], output_translation_lang: Optional[str]
+) -> str:
+    """Compose the system guidance; identical for every turn with the same languages."""
     # System guidance to drive autonomous tool usage and translation
     system_parts: list[str] = [
         "You are a research assistant. Use tools to gather sources and synthesize a concise, cited answer.",
@@ -168,11 +670,44 @@ def run_research(
         system_parts.append(
             f"Deliver the final answer in {output_translation_lang}. You may call translate_text to produce this."
         )
+    return " ".join(system_parts)
+
+
+async def run_research_async(
+    topic_or_query: str,
+    depth: str = "standard",
+    source_translation_lang: Optional[str] = None,
+    output_translation_lang: Optional[str] = None,
+) -> str:
+    """Minimal-input research flow using tool-calling.
+
+    The model will call `search_web` to gather sources and `translate_text` when needed.
+    If `output_translation_lang` is provided, the final answer should be in that language,
+    and the model may call `translate_text` to produce it. Tool calls from the same
+    response are dispatched concurrently.
+    """
+    openai_key = os.environ.get("OPENAI_API_KEY")
+    linkup_key = os.environ.get("LINKUP_API_KEY")
+    if not openai_key:
+        raise RuntimeError("OPENAI_API_KEY is required")
+    if not linkup_key:
+        raise RuntimeError("LINKUP_API_KEY is required")
+
+    openai_client = _get_openai()
+    session = _ResearchSession(
+        topic_or_query=topic_or_query,
+        depth=depth,
+        output_translation_lang=output_translation_lang,
+    )
+
+    tools = _TOOLS_SCHEMA
 
     input_list: list[dict[str, Any]] = [
         {
             "role": "system",
-            "content": " ".join(system_parts),
+            "content": _system_prompt(
+                source_translation_lang, output_translation_lang
+            ),
         },
         {
             "role": "user",
@@ -181,236 +716,115 @@ def run_research(
     ]
 
     max_iterations = 3
-    deepl_used = False
     last_response = None
-    for _ in range(max_iterations):
-        response = openai_client.responses.create(
-            model="gpt-5-nano",
-            tools=tools,
-            input=input_list,
-        )
+    for iteration in range(max_iterations):
+        # Outputs of the last turn's tool calls would never reach the model
+        last_turn = iteration == max_iterations - 1
+        calls: list[Any] = []
+        keys: list[tuple[Optional[str], str]] = []
+        started: dict[tuple[Optional[str], str], "asyncio.Task[dict[str, Any]]"] = {}
+        response = None
+        async for event in _stream_response_events(openai_client, tools, input_list):
+            event_type = getattr(event, "type", None)
+            if event_type == "response.output_item.done":
+                item = event.item
+                if getattr(item, "type", None) != "function_call":
+                    continue
+                # Start tool I/O while the model is still generating; translations
+                # wait for the stream to end so they can be batched, and repeats of
+                # a started call share its task
+                key = _call_key(item)
+                if (
+                    not last_turn
+                    and key not in started
+                    and getattr(item, "name", None) != "translate_text"
+                ):
+                    started[key] = asyncio.create_task(_handle_call(item, session))
+                calls.append(item)
+                keys.append(key)
+            elif event_type in _FINAL_RESPONSE_EVENTS:
+                response = event.response
+        if response is None:
+            raise RuntimeError("OpenAI response stream ended without a final response")
         last_response = response
         input_list += response.output
 
-        made_tool_call = False
-        for item in response.output:
-            if getattr(item, "type", None) == "function_call":
-                made_tool_call = True
-                name = getattr(item, "name", None)
-                args = json.loads(getattr(item, "arguments", "{}"))
-
-                if name == "search_web":
-                    q = args.get("query") or topic_or_query
-                    req_depth = args.get("depth") or depth
-                    linkup_response = linkup_client.search(
-                        query=q,
-                        depth=req_depth,
-                        output_type="searchResults",
-                        include_images=False,
-                    )
-                    output_json = json.dumps(linkup_response.model_dump(), indent=2)
-                    input_list.append(
-                        {
-                            "type": "function_call_output",
-                            "call_id": getattr(item, "call_id", "search_web_call"),
-                            "output": output_json,
-                        }
-                    )
-
-                elif name == "translate_text":
-                    if not deepl_client:
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "translate_text_call"
-                                ),
-                                "output": json.dumps(
-                                    {
-                                        "error": "DEEPL_AUTH_KEY not set; translation unavailable",
-                                    }
-                                ),
-                            }
-                        )
-                    else:
-                        text = args.get("text", "")
-                        target_lang = args.get(
-                            "target_lang", output_translation_lang or "EN"
-                        )
-                        source_lang = args.get("source_lang")
-                        formality = args.get("formality")
-                        translated = deepl_client.translate_text(
-                            text,
-                            target_lang=target_lang,
-                            source_lang=source_lang,
-                            formality=formality,
-                        )
-                        translated_text = (
-                            translated.text
-                            if hasattr(translated, "text")
-                            else str(translated)
-                        )
-                        deepl_used = True
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "translate_text_call"
-                                ),
-                                "output": json.dumps(
-                                    {"translated_text": translated_text}
-                                ),
-                            }
-                        )
-
-                elif name == "find_local_sources_by_place":
-                    place = args.get("place") or topic_or_query
-                    native_language = args.get("native_language")
-                    top_n = args.get("top_n") or 10
-                    if not place:
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "find_local_sources_call"
-                                ),
-                                "output": json.dumps({"error": "place is required"}),
-                            }
-                        )
-                    elif not native_language:
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "find_local_sources_call"
-                                ),
-                                "output": json.dumps(
-                                    {"error": "native_language is required"}
-                                ),
-                            }
-                        )
-                    else:
-                        language_phrase = f" in {native_language}"
-                        q2 = (
-                            f"local news websites for {place}{language_phrase}; "
-                            f"official newspaper, tv, radio sites; "
-                            f"sources in {native_language} only; do not translate"
-                        )
-                        linkup_response = linkup_client.search(
-                            query=q2,
-                            depth="standard",
-                            output_type="searchResults",
-                            include_images=False,
-                        )
-
-                        def extract_urls_from_obj(obj: Any) -> list[str]:
-                            collected: list[str] = []
-                            if isinstance(obj, dict):
-                                for key, value in obj.items():
-                                    if key.lower() == "url" and isinstance(value, str):
-                                        collected.append(value)
-                                    else:
-                                        collected.extend(extract_urls_from_obj(value))
-                            elif isinstance(obj, list):
-                                for element in obj:
-                                    collected.extend(extract_urls_from_obj(element))
-                            return collected
-
-                        raw_dump = linkup_response.model_dump()
-                        all_urls = extract_urls_from_obj(raw_dump)
-                        seen: set[str] = set()
-                        deduped_urls: list[str] = []
-                        for url in all_urls:
-                            if url not in seen:
-                                seen.add(url)
-                                deduped_urls.append(url)
-                        sites = deduped_urls[: int(top_n)]
-
-                        output_payload = {
-                            "place": place,
-                            "native_language": native_language,
-                            "sites": sites,
-                        }
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "find_local_sources_call"
-                                ),
-                                "output": json.dumps(output_payload),
-                            }
-                        )
-
-                elif name == "search_local_news":
-                    place = args.get("place") or topic_or_query
-                    sites = args.get("sites") or []
-                    native_language = args.get("native_language")
-                    since_days = int(args.get("since_days") or 7)
-                    if not place:
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "search_local_news_call"
-                                ),
-                                "output": json.dumps({"error": "place is required"}),
-                            }
-                        )
-                    elif not native_language:
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "search_local_news_call"
-                                ),
-                                "output": json.dumps(
-                                    {"error": "native_language is required"}
-                                ),
-                            }
-                        )
-                    else:
-                        site_filter = ""
-                        if isinstance(sites, list) and len(sites) > 0:
-                            site_terms = []
-                            for s in sites[:10]:
-                                site_terms.append(f"site:{s}")
-                            site_filter = "(" + " OR ".join(site_terms) + ") "
-                        language_phrase = f" in {native_language}"
-                        q3 = (
-                            f"{site_filter}{place} local news{language_phrase} last {since_days} days; "
-                            f"content in {native_language} only; do not translate"
-                        )
-                        linkup_response = linkup_client.search(
-                            query=q3,
-                            depth="standard",
-                            output_type="searchResults",
-                            include_images=False,
-                        )
-                        output_json = json.dumps(linkup_response.model_dump(), indent=2)
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "search_local_news_call"
-                                ),
-                                "output": output_json,
-                            }
-                        )
-
-        if not made_tool_call:
+        if not calls or last_turn or _has_final_answer(response.output):
+            for task in started.values():
+                task.cancel()
             break
 
+        deferred = [index for index, key in enumerate(keys) if key not in started]
+        outputs: list[Optional[dict[str, Any]]] = [None] * len(calls)
+        deferred_outputs = await _dispatch_calls(
+            [calls[index] for index in deferred], session
+        )
+        for index, output in zip(deferred, deferred_outputs):
+            outputs[index] = output
+        for index, key in enumerate(keys):
+            if key in started:
+                outputs[index] = _reuse_output(await started[key], calls[index])
+        input_list += outputs
+
     final_text = getattr(last_response, "output_text", "") if last_response else ""
-    if deepl_used:
+    if session.deepl_used:
         suffix = "\n\n[Note: Some content was translated via DeepL]"
     else:
         suffix = "\n\n[Note: No DeepL translation was used]"
     return (final_text + suffix) if final_text else suffix
 
 
+def run_research(
+    topic_or_query: str,
+    depth: str = "standard",
+    source_translation_lang: Optional[str] = None,
+    output_translation_lang: Optional[str] = None,
+) -> str:
+    """Synchronous wrapper around `run_research_async`."""
+    return asyncio.run(
+        run_research_async(
+            topic_or_query=topic_or_query,
+            depth=depth,
+            source_translation_lang=source_translation_lang,
+            output_translation_lang=output_translation_lang,
+        )
+    )
+
+
+def _set_depth(settings: dict[str, Optional[str]], arg: str) -> None:
+    if arg in {"standard", "deep"}:
+        settings["depth"] = arg
+        print(f"Depth set to {arg}")
+    else:
+        print("Usage: /depth standard|deep")
+
+
+def _set_src_lang(settings: dict[str, Optional[str]], arg: str) -> None:
+    settings["src_lang"] = arg.upper() or None
+    print(f"Source translation language: {settings['src_lang']}")
+
+
+def _set_out_lang(settings: dict[str, Optional[str]], arg: str) -> None:
+    settings["out_lang"] = arg.upper() or None
+    print(f"Output translation language: {settings['out_lang']}")
+
+
+_CHAT_COMMANDS = {
+    "/depth": _set_depth,
+    "/srclang": _set_src_lang,
+    "/outlang": _set_out_lang,
+}
+_QUIT_COMMANDS = frozenset({"/quit", "/exit", "quit", "exit"})
+
+
 def _chat_loop(depth: str, src_lang: Optional[str], out_lang: Optional[str]) -> None:
     print("💬 Research Chat (Linkup + DeepL via tools)")
     print("Commands: /depth standard|deep, /srclang CODE, /outlang CODE, /quit")
+    settings: dict[str, Optional[str]] = {
+        "depth": depth,
+        "src_lang": src_lang,
+        "out_lang": out_lang,
+    }
     while True:
         try:
             prompt = input("\n> ").strip()
@@ -419,32 +833,19 @@ def _chat_loop(depth: str, src_lang: Optional[str], out_lang: Optional[str]) ->
 
         if not prompt:
             continue
-        if prompt.lower() in {"/quit", "/exit", "quit", "exit"}:
+        if prompt.lower() in _QUIT_COMMANDS:
             break
-        if prompt.startswith("/depth"):
-            _, *rest = prompt.split()
-            if rest and rest[0] in {"standard", "deep"}:
-                depth = rest[0]
-                print(f"Depth set to {depth}")
-            else:
-                print("Usage: /depth standard|deep")
-            continue
-        if prompt.startswith("/srclang"):
-            _, *rest = prompt.split()
-            src_lang = rest[0].upper() if rest else None
-            print(f"Source translation language: {src_lang}")
-            continue
-        if prompt.startswith("/outlang"):
-            _, *rest = prompt.split()
-            out_lang = rest[0].upper() if rest else None
-            print(f"Output translation language: {out_lang}")
+        parts = prompt.split()
+        handler = _CHAT_COMMANDS.get(parts[0])
+        if handler is not None:
+            handler(settings, parts[1] if len(parts) > 1 else "")
             continue
 
         result = run_research(
             topic_or_query=prompt,
-            depth=depth,
-            source_translation_lang=src_lang,
-            output_translation_lang=out_lang,
+            depth=settings["depth"],
+            source_translation_lang=settings["src_lang"],
+            output_translation_lang=settings["out_lang"],
         )
         print(f"\n{result}")
 
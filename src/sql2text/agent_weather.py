@@ -1,11 +1,25 @@
 import argparse
+import atexit
+import hashlib
 import json
 import os
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
 
-import deepl
-from linkup import LinkupClient
-from openai import OpenAI
+# The SDKs are imported on first use by the client factories below, so importing
+# this module (or running --help) does not pay for their pydantic/httpx setup
+if TYPE_CHECKING:
+    from deepl import DeepLClient
+    from linkup import LinkupClient
+    from openai import OpenAI
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 
 def create_tools_schema() -> list[dict[str, Any]]:
@@ -120,6 +134,531 @@ def create_tools_schema() -> list[dict[str, Any]]:
     ]
 
 
+# The schema has no inputs, so build it once instead of on every agent run
+_TOOLS_SCHEMA: list[dict[str, Any]] = create_tools_schema()
+
+
+# Clients are created once per process and shared by both agents (and the tool
+# threads), so repeated runs reuse pooled keep-alive connections
+_OPENAI: Optional["OpenAI"] = None
+_LINKUP: Optional["LinkupClient"] = None
+_DEEPL: Optional["DeepLClient"] = None
+_clients_lock = threading.Lock()
+
+
+def _get_openai() -> "OpenAI":
+    """Return the shared OpenAI client, creating it on first use."""
+    global _OPENAI
+    with _clients_lock:
+        if _OPENAI is None:
+            import httpx
+            from openai import DefaultHttpxClient, OpenAI
+
+            _OPENAI = OpenAI(
+                api_key=os.environ["OPENAI_API_KEY"],
+                http_client=DefaultHttpxClient(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=20, max_connections=100
+                    ),
+                    timeout=30.0,
+                ),
+            )
+            atexit.register(_OPENAI.close)
+        return _OPENAI
+
+
+def _get_linkup() -> "LinkupClient":
+    """Return the shared LinkupClient, creating it on first use."""
+    global _LINKUP
+    with _clients_lock:
+        if _LINKUP is None:
+            from linkup import LinkupClient
+
+            _LINKUP = LinkupClient(api_key=os.environ["LINKUP_API_KEY"])
+        return _LINKUP
+
+
+def _get_deepl() -> Optional["DeepLClient"]:
+    """Return the shared DeepLClient, or None if DEEPL_AUTH_KEY is not set."""
+    global _DEEPL
+    with _clients_lock:
+        if _DEEPL is None:
+            deepl_key = os.environ.get("DEEPL_AUTH_KEY")
+            if deepl_key:
+                from deepl import DeepLClient
+
+                _DEEPL = DeepLClient(deepl_key)
+        return _DEEPL
+
+
+class _TTLCache:
+    """In-process LRU whose entries expire after `ttl_seconds`.
+
+    Anything exposing the same `get`/`set` pair (e.g. a Redis-backed store) can be
+    swapped in for `_LLM_CACHE` / `_SEARCH_CACHE`.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# Weather and news go stale, so repeats are only served for a short window
+_CACHE_TTL_SECONDS = 15 * 60
+_LLM_CACHE = _TTLCache(maxsize=128, ttl_seconds=_CACHE_TTL_SECONDS)
+_SEARCH_CACHE = _TTLCache(maxsize=256, ttl_seconds=_CACHE_TTL_SECONDS)
+
+
+def _jsonable(obj: Any) -> Any:
+    # Response items in input_list are pydantic models
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+
+def _cache_key(payload: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=_jsonable).encode("utf-8")
+    ).hexdigest()
+
+
+def _create_response(
+    openai_client: "OpenAI",
+    tools: list[dict[str, Any]],
+    input_list: list[Any],
+    prompt_cache_key: str,
+) -> Any:
+    """`responses.create` for gpt-5-nano, reusing the result of an identical request.
+
+    `input_list` must only ever grow by appending (system, user, then model output
+    and tool outputs), so each turn shares the previous turn's prefix; together with
+    `prompt_cache_key` this lets OpenAI serve that prefix from its prompt cache.
+    """
+    key = _cache_key({"model": "gpt-5-nano", "input": input_list, "tools": tools})
+    response = _LLM_CACHE.get(key)
+    if response is None:
+        response = openai_client.responses.create(
+            model="gpt-5-nano",
+            tools=tools,
+            input=input_list,
+            prompt_cache_key=prompt_cache_key,
+        )
+        _LLM_CACHE.set(key, response)
+    return response
+
+
+def _linkup_search(linkup_client: "LinkupClient", query: str) -> Any:
+    """Standard-depth Linkup `searchResults` search, reusing recent identical ones."""
+    key = _cache_key([query, "standard", "searchResults"])
+    linkup_response = _SEARCH_CACHE.get(key)
+    if linkup_response is None:
+        linkup_response = linkup_client.search(
+            query=query,
+            depth="standard",
+            output_type="searchResults",
+            include_images=False,
+        )
+        _SEARCH_CACHE.set(key, linkup_response)
+    return linkup_response
+
+
+# orjson is optional; tool arguments and outputs are parsed/encoded on every call
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
+# Tool calls are independent HTTP round-trips, so a few threads cover a response
+_MAX_TOOL_WORKERS = 8
+
+
+def _weather_sources_query(place: str, native_language: str) -> str:
+    language_phrase = f" in {native_language}"
+    # Enforce original-language sources without hardcoding language-specific keywords
+    return (
+        f"local news websites for {place}{language_phrase}; "
+        f"official newspaper, tv, radio sites; "
+        f"sources in {native_language} only; do not translate"
+    )
+
+
+def _weather_news_query(
+    site_filter: str, place: str, native_language: str, since_days: int
+) -> str:
+    language_phrase = f" in {native_language}"
+    return (
+        f"{site_filter}{place} local news{language_phrase} last {since_days} days; "
+        f"content in {native_language} only; do not translate"
+    )
+
+
+# Native-script "news" terms that steer searches towards local-language outlets;
+# add a language here to give its queries the same hints
+_NATIVE_NEWS_TERMS = {
+    "Tamil": "தமிழ் செய்திகள்",
+}
+# casefolded language -> (source discovery hint, news search hint)
+_LANG_HINTS: dict[str, tuple[str, str]] = {
+    language.casefold(): (
+        f"{term}; {language} newspaper; ",
+        f"{term}; {language} news; ",
+    )
+    for language, term in _NATIVE_NEWS_TERMS.items()
+}
+_NO_HINTS = ("", "")
+
+
+def _local_sources_query(place: str, native_language: str) -> str:
+    hint = _LANG_HINTS.get(native_language.casefold(), _NO_HINTS)[0]
+    return (
+        f"local news websites for {place} in {native_language}; {hint}"
+        f"official newspaper, tv, radio sites; {native_language} language only"
+    )
+
+
+def _local_news_query(
+    site_filter: str, place: str, native_language: str, since_days: int
+) -> str:
+    hint = _LANG_HINTS.get(native_language.casefold(), _NO_HINTS)[1]
+    return (
+        f"{site_filter}{place} local news in {native_language} last {since_days} days; "
+        f"{hint}{native_language} language content only"
+    )
+
+
+class _ToolContext:
+    """Shared clients, per-agent defaults and per-run memo used by the tool handlers.
+
+    One context lives for a single agent run, so its memo catches searches and
+    translations the model repeats across turns even after the TTL cache dropped them.
+    """
+
+    def __init__(
+        self,
+        default_query: str,
+        default_place: str,
+        sources_query: Callable[[str, str], str],
+        news_query: Callable[[str, str, str, int], str],
+    ):
+        self.linkup_client = _get_linkup()
+        self.deepl_client = _get_deepl()
+        self.default_query = default_query
+        self.default_place = default_place
+        self.sources_query = sources_query
+        self.news_query = news_query
+        self.searches: dict[str, Any] = {}
+        self.translations: dict[tuple[str, str, Any, Any], str] = {}
+
+    def search(self, query: str) -> Any:
+        linkup_response = self.searches.get(query)
+        if linkup_response is None:
+            linkup_response = _linkup_search(self.linkup_client, query)
+            self.searches[query] = linkup_response
+        return linkup_response
+
+
+def _search_web(args: dict[str, Any], ctx: _ToolContext) -> str:
+    query = args.get("query") or ctx.default_query
+    linkup_response = ctx.search(query)
+    # Serialized by pydantic-core directly; compact, since whitespace costs tokens
+    return linkup_response.model_dump_json()
+
+
+def _translate_text(args: dict[str, Any], ctx: _ToolContext) -> str:
+    if not ctx.deepl_client:
+        return _json_dumps({"error": "DEEPL_AUTH_KEY not set; translation unavailable"})
+    text = args.get("text", "")
+    target_lang = args.get("target_lang", "EN")
+    source_lang = args.get("source_lang")
+    formality = args.get("formality")
+
+    key = (text, target_lang, source_lang, formality)
+    translated_text = ctx.translations.get(key)
+    if translated_text is None:
+        translated = ctx.deepl_client.translate_text(
+            text,
+            target_lang=target_lang,
+            source_lang=source_lang,
+            formality=formality,
+        )
+        # The SDK returns either a string or a TextResult object; normalize to string
+        translated_text = (
+            translated.text if hasattr(translated, "text") else str(translated)
+        )
+        ctx.translations[key] = translated_text
+    return _json_dumps({"translated_text": translated_text})
+
+
+def _iter_result_urls(linkup_response: Any) -> Iterator[str]:
+    """Yield the `url` of each item in a `searchResults` response, in ranking order."""
+    for result in linkup_response.results:
+        url = getattr(result, "url", None)
+        if url:
+            yield url
+
+
+class _LocalToolArgs:
+    """Arguments shared by the local-source tools, coerced and validated once.
+
+    Raises ValueError for a missing place or native_language; `_handle_call`
+    reports that to the model as `{"error": ...}`.
+    """
+
+    __slots__ = ("place", "native_language", "top_n", "sites", "since_days")
+
+    def __init__(self, args: dict[str, Any], ctx: _ToolContext):
+        self.place: str = args.get("place") or ctx.default_place
+        self.native_language: Optional[str] = args.get("native_language")
+        self.top_n = int(args.get("top_n") or 10)
+        sites = args.get("sites")
+        self.sites: list[str] = sites if isinstance(sites, list) else []
+        self.since_days = int(args.get("since_days") or 7)
+        if not self.place:
+            raise ValueError("place is required")
+        if not self.native_language:
+            raise ValueError("native_language is required")
+
+
+def _find_local_sources_by_place(args: dict[str, Any], ctx: _ToolContext) -> str:
+    a = _LocalToolArgs(args, ctx)
+    linkup_response = ctx.search(ctx.sources_query(a.place, a.native_language))
+
+    # Deduplicate while preserving order, and stop once top_n are found
+    found: dict[str, None] = {}
+    if a.top_n > 0:
+        for url in _iter_result_urls(linkup_response):
+            found[url] = None
+            if len(found) >= a.top_n:
+                break
+    sites = list(found)
+
+    output_payload = {
+        "place": a.place,
+        "native_language": a.native_language,
+        "sites": sites,
+    }
+    return _json_dumps(output_payload)
+
+
+def _search_local_news(args: dict[str, Any], ctx: _ToolContext) -> str:
+    a = _LocalToolArgs(args, ctx)
+    site_filter = ""
+    if a.sites:
+        site_terms = []
+        for s in a.sites[:10]:
+            site_terms.append(f"site:{s}")
+        site_filter = "(" + " OR ".join(site_terms) + ") "
+    linkup_response = ctx.search(
+        ctx.news_query(site_filter, a.place, a.native_language, a.since_days)
+    )
+    # Serialized by pydantic-core directly; compact, since whitespace costs tokens
+    return linkup_response.model_dump_json()
+
+
+_TOOL_HANDLERS: dict[str, Callable[[dict[str, Any], _ToolContext], str]] = {
+    "search_web": _search_web,
+    "translate_text": _translate_text,
+    "find_local_sources_by_place": _find_local_sources_by_place,
+    "search_local_news": _search_local_news,
+}
+
+
+def _handle_call(item: Any, ctx: _ToolContext) -> dict[str, Any]:
+    """Run one function_call item and build its function_call_output entry.
+
+    Errors are reported back to the model as `{"error": ...}` instead of raising, so
+    one failing tool does not discard the results of the others.
+    """
+    # function_call items always carry name, call_id and arguments
+    handler = _TOOL_HANDLERS.get(item.name)
+    try:
+        if handler is None:
+            output = _json_dumps({"error": f"Unknown tool: {item.name}"})
+        else:
+            output = handler(_json_loads(item.arguments or "{}"), ctx)
+    except Exception as e:
+        output = _json_dumps({"error": str(e)})
+    return {
+        "type": "function_call_output",
+        "call_id": item.call_id,
+        "output": output,
+    }
+
+
+def _translate_options(item: Any) -> Optional[tuple[str, Any, Any]]:
+    """DeepL options of a translate_text call; None for other or unparsable calls."""
+    if item.name != "translate_text":
+        return None
+    try:
+        args = _json_loads(item.arguments or "{}")
+    except ValueError:
+        return None
+    return (
+        args.get("target_lang", "EN"),
+        args.get("source_lang"),
+        args.get("formality"),
+    )
+
+
+def _translate_batch(
+    items: list[Any], options: tuple[str, Any, Any], ctx: _ToolContext
+) -> list[dict[str, Any]]:
+    """Translate several translate_text calls sharing `options` in one DeepL request."""
+    target_lang, source_lang, formality = options
+    texts = [_json_loads(item.arguments or "{}").get("text", "") for item in items]
+    try:
+        results = ctx.deepl_client.translate_text(
+            texts,
+            target_lang=target_lang,
+            source_lang=source_lang,
+            formality=formality,
+        )
+        translated_texts = [r.text if hasattr(r, "text") else str(r) for r in results]
+        for text, translated_text in zip(texts, translated_texts):
+            ctx.translations[(text, target_lang, source_lang, formality)] = (
+                translated_text
+            )
+        outputs = [
+            _json_dumps({"translated_text": translated_text})
+            for translated_text in translated_texts
+        ]
+    except Exception as e:
+        outputs = [_json_dumps({"error": str(e)})] * len(items)
+    return [
+        {
+            "type": "function_call_output",
+            "call_id": item.call_id,
+            "output": output,
+        }
+        for item, output in zip(items, outputs)
+    ]
+
+
+def _run_tool_calls(
+    response_output: list[Any], ctx: _ToolContext
+) -> list[dict[str, Any]]:
+    """Execute the function_call items of a response concurrently, in their order.
+
+    translate_text calls sharing target/source language and formality are sent to
+    DeepL as one batched request.
+    """
+    calls = [
+        item
+        for item in response_output
+        if getattr(item, "type", None) == "function_call"
+    ]
+
+    if not calls:
+        return []
+
+    groups: dict[tuple[str, Any, Any], list[int]] = {}
+    if ctx.deepl_client:
+        for index, item in enumerate(calls):
+            options = _translate_options(item)
+            if options is not None:
+                groups.setdefault(options, []).append(index)
+    batches = {
+        options: indexes for options, indexes in groups.items() if len(indexes) > 1
+    }
+    batched = {index for indexes in batches.values() for index in indexes}
+    singles = [index for index in range(len(calls)) if index not in batched]
+
+    workers = min(_MAX_TOOL_WORKERS, len(singles) + len(batches))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        single_futures = [
+            (index, ex.submit(_handle_call, calls[index], ctx)) for index in singles
+        ]
+        batch_futures = [
+            (
+                indexes,
+                ex.submit(
+                    _translate_batch, [calls[i] for i in indexes], options, ctx
+                ),
+            )
+            for options, indexes in batches.items()
+        ]
+
+    outputs: list[Optional[dict[str, Any]]] = [None] * len(calls)
+    for index, future in single_futures:
+        outputs[index] = future.result()
+    for indexes, future in batch_futures:
+        for index, output in zip(indexes, future.result()):
+            outputs[index] = output
+    return outputs
+
+
+# System messages are shared read-only dicts, so every request of an agent starts
+# with a byte-identical prefix that server-side prompt caching can reuse
+
+# Seed conversation: include guidance for prioritizing native-language local sources when asked for local news
+_WEATHER_SYSTEM_MSG: dict[str, Any] = {
+    "role": "system",
+    "content": (
+        "When the user asks for local news, you MUST determine the native language of the place and use it."
+        " For example: Chennai/Tamil Nadu = Tamil, Mumbai/Maharashtra = Marathi, Delhi = Hindi, etc."
+        " First discover local news websites for the place REQUIRING sources in the area's native language"
+        " (use find_local_sources_by_place with the correct native language),"
+        " then search those sources for recent updates (use search_local_news with the same language)."
+        " Always cite sources. You MUST always specify the native language when calling these functions."
+    ),
+}
+
+# System guidance for minimal-input local news workflow
+_NEWS_SYSTEM_MSG: dict[str, Any] = {
+    "role": "system",
+    "content": (
+        "When asked for local news, infer the place from the user's text and determine its native language."
+        " Common mappings: Chennai/Tamil Nadu = Tamil, Mumbai/Maharashtra = Marathi, Delhi = Hindi,"
+        " Kolkata/West Bengal = Bengali, Bangalore/Karnataka = Kannada, Hyderabad/Telangana = Telugu, etc."
+        " EXAMPLE: For 'Chennai news' -> use find_local_sources_by_place(place='Chennai', native_language='Tamil')"
+        " First discover local news websites for the place REQUIRING sources in the area's native language"
+        " using find_local_sources_by_place, then search those sites for recent updates using search_local_news."
+        " Write the final answer in English, translating brief quotes if necessary (you may call translate_text)."
+        " Always include concise citations to the strongest local sources."
+        " You MUST always specify the native language when calling these functions."
+    ),
+}
+
+
+# Requests of one agent share a long prefix; sending them under a common key keeps
+# them routed to the same prompt cache
+_WEATHER_PROMPT_CACHE_KEY = "sql2text-weather-agent"
+_NEWS_PROMPT_CACHE_KEY = "sql2text-news-agent"
+
+
+def _require_api_keys() -> None:
+    if not os.environ.get("OPENAI_API_KEY"):
+        raise RuntimeError("OPENAI_API_KEY is required")
+    if not os.environ.get("LINKUP_API_KEY"):
+        raise RuntimeError("LINKUP_API_KEY is required")
+
+
 def run_weather_agent(city: str) -> str:
     """Use OpenAI tool calling + Linkup search to get current weather for a city.
 
@@ -127,253 +666,42 @@ def run_weather_agent(city: str) -> str:
       - OPENAI_API_KEY
       - LINKUP_API_KEY
     """
-    openai_api_key = os.environ.get("OPENAI_API_KEY")
-    linkup_api_key = os.environ.get("LINKUP_API_KEY")
-    if not openai_api_key:
-        raise RuntimeError("OPENAI_API_KEY is required")
-    if not linkup_api_key:
-        raise RuntimeError("LINKUP_API_KEY is required")
+    _require_api_keys()
+    openai_client = _get_openai()
 
-    openai_client = OpenAI(api_key=openai_api_key)
-    linkup_client = LinkupClient(api_key=linkup_api_key)
-    deepl_key = os.environ.get("DEEPL_AUTH_KEY")
-    deepl_client = deepl.DeepLClient(deepl_key) if deepl_key else None
+    tools = _TOOLS_SCHEMA
 
-    tools = create_tools_schema()
-
-    # Seed conversation: include guidance for prioritizing native-language local sources when asked for local news
     input_list: list[dict[str, Any]] = [
-        {
-            "role": "system",
-            "content": (
-                "When the user asks for local news, you MUST determine the native language of the place and use it."
-                " For example: Chennai/Tamil Nadu = Tamil, Mumbai/Maharashtra = Marathi, Delhi = Hindi, etc."
-                " First discover local news websites for the place REQUIRING sources in the area's native language"
-                " (use find_local_sources_by_place with the correct native language),"
-                " then search those sources for recent updates (use search_local_news with the same language)."
-                " Always cite sources. You MUST always specify the native language when calling these functions."
-            ),
-        },
+        _WEATHER_SYSTEM_MSG,
         {
             "role": "user",
             "content": f"What's the current weather in {city}? Please cite sources.",
         },
     ]
 
-    response = openai_client.responses.create(
-        model="gpt-5-nano",
-        tools=tools,
-        input=input_list,
+    response = _create_response(
+        openai_client, tools, input_list, _WEATHER_PROMPT_CACHE_KEY
     )
 
     # Append model output (which may include function call requests)
     input_list += response.output
 
     # Execute tool calls
-    for item in response.output:
-        if getattr(item, "type", None) == "function_call":
-            name = getattr(item, "name", None)
-            args = json.loads(getattr(item, "arguments", "{}"))
-
-            if name == "search_web":
-                query = args.get("query") or f"current weather in {city}"
-                linkup_response = linkup_client.search(
-                    query=query,
-                    depth="standard",
-                    output_type="searchResults",
-                    include_images=False,
-                )
-                output_json = json.dumps(linkup_response.model_dump(), indent=2)
-                input_list.append(
-                    {
-                        "type": "function_call_output",
-                        "call_id": getattr(item, "call_id", "search_web_call"),
-                        "output": output_json,
-                    }
-                )
-
-            elif name == "translate_text":
-                if not deepl_client:
-                    input_list.append(
-                        {
-                            "type": "function_call_output",
-                            "call_id": getattr(item, "call_id", "translate_text_call"),
-                            "output": json.dumps(
-                                {
-                                    "error": "DEEPL_AUTH_KEY not set; translation unavailable"
-                                }
-                            ),
-                        }
-                    )
-                else:
-                    text = args.get("text", "")
-                    target_lang = args.get("target_lang", "EN")
-                    source_lang = args.get("source_lang")
-                    formality = args.get("formality")
-
-                    translated = deepl_client.translate_text(
-                        text,
-                        target_lang=target_lang,
-                        source_lang=source_lang,
-                        formality=formality,
-                    )
-                    # The SDK returns either a string or a TextResult object; normalize to string
-                    translated_text = (
-                        translated.text
-                        if hasattr(translated, "text")
-                        else str(translated)
-                    )
-                    input_list.append(
-                        {
-                            "type": "function_call_output",
-                            "call_id": getattr(item, "call_id", "translate_text_call"),
-                            "output": json.dumps({"translated_text": translated_text}),
-                        }
-                    )
-
-            elif name == "find_local_sources_by_place":
-                place = args.get("place", "")
-                native_language = args.get("native_language")
-                top_n = args.get("top_n") or 10
-
-                if not place:
-                    input_list.append(
-                        {
-                            "type": "function_call_output",
-                            "call_id": getattr(
-                                item, "call_id", "find_local_sources_call"
-                            ),
-                            "output": json.dumps({"error": "place is required"}),
-                        }
-                    )
-                elif not native_language:
-                    input_list.append(
-                        {
-                            "type": "function_call_output",
-                            "call_id": getattr(
-                                item, "call_id", "find_local_sources_call"
-                            ),
-                            "output": json.dumps(
-                                {"error": "native_language is required"}
-                            ),
-                        }
-                    )
-                else:
-                    language_phrase = f" in {native_language}"
-                    # Enforce original-language sources without hardcoding language-specific keywords
-                    query = (
-                        f"local news websites for {place}{language_phrase}; "
-                        f"official newspaper, tv, radio sites; "
-                        f"sources in {native_language} only; do not translate"
-                    )
-                    linkup_response = linkup_client.search(
-                        query=query,
-                        depth="standard",
-                        output_type="searchResults",
-                        include_images=False,
-                    )
-
-                    def extract_urls_from_obj(obj: Any) -> list[str]:
-                        collected: list[str] = []
-                        if isinstance(obj, dict):
-                            for key, value in obj.items():
-                                if key.lower() == "url" and isinstance(value, str):
-                                    collected.append(value)
-                                else:
-                                    collected.extend(extract_urls_from_obj(value))
-                        elif isinstance(obj, list):
-                            for element in obj:
-                                collected.extend(extract_urls_from_obj(element))
-                        return collected
-
-                    raw_dump = linkup_response.model_dump()
-                    all_urls = extract_urls_from_obj(raw_dump)
-                    # Deduplicate while preserving order
-                    seen: set[str] = set()
-                    deduped_urls: list[str] = []
-                    for url in all_urls:
-                        if url not in seen:
-                            seen.add(url)
-                            deduped_urls.append(url)
-                    sites = deduped_urls[: int(top_n)]
-
-                    output_payload = {
-                        "place": place,
-                        "native_language": native_language,
-                        "sites": sites,
-                    }
-                    input_list.append(
-                        {
-                            "type": "function_call_output",
-                            "call_id": getattr(
-                                item, "call_id", "find_local_sources_call"
-                            ),
-                            "output": json.dumps(output_payload),
-                        }
-                    )
-
-            elif name == "search_local_news":
-                place = args.get("place", "")
-                sites = args.get("sites") or []
-                native_language = args.get("native_language")
-                since_days = int(args.get("since_days") or 7)
-
-                if not place:
-                    input_list.append(
-                        {
-                            "type": "function_call_output",
-                            "call_id": getattr(
-                                item, "call_id", "search_local_news_call"
-                            ),
-                            "output": json.dumps({"error": "place is required"}),
-                        }
-                    )
-                elif not native_language:
-                    input_list.append(
-                        {
-                            "type": "function_call_output",
-                            "call_id": getattr(
-                                item, "call_id", "search_local_news_call"
-                            ),
-                            "output": json.dumps(
-                                {"error": "native_language is required"}
-                            ),
-                        }
-                    )
-                else:
-                    site_filter = ""
-                    if isinstance(sites, list) and len(sites) > 0:
-                        site_terms = []
-                        for s in sites[:10]:
-                            site_terms.append(f"site:{s}")
-                        site_filter = "(" + " OR ".join(site_terms) + ") "
-                    language_phrase = f" in {native_language}"
-                    query = (
-                        f"{site_filter}{place} local news{language_phrase} last {since_days} days; "
-                        f"content in {native_language} only; do not translate"
-                    )
-                    linkup_response = linkup_client.search(
-                        query=query,
-                        depth="standard",
-                        output_type="searchResults",
-                        include_images=False,
-                    )
-                    output_json = json.dumps(linkup_response.model_dump(), indent=2)
-                    input_list.append(
-                        {
-                            "type": "function_call_output",
-                            "call_id": getattr(
-                                item, "call_id", "search_local_news_call"
-                            ),
-                            "output": output_json,
-                        }
-                    )
+    ctx = _ToolContext(
+        default_query=f"current weather in {city}",
+        default_place="",
+        sources_query=_weather_sources_query,
+        news_query=_weather_news_query,
+    )
+    outputs = _run_tool_calls(response.output, ctx)
+    if not outputs:
+        # No tools were requested, so the first response already is the answer
+        return getattr(response, "output_text", "")
+    input_list += outputs
 
     # Ask the model to synthesize an answer with citations
-    final = openai_client.responses.create(
-        model="gpt-5-nano",
-        tools=tools,
-        input=input_list,
+    final = _create_response(
+        openai_client, tools, input_list, _WEATHER_PROMPT_CACHE_KEY
     )
 
     return getattr(final, "output_text", "")
@@ -392,256 +720,40 @@ def run_local_news_agent(query: str) -> str:
       - OPENAI_API_KEY
       - LINKUP_API_KEY
     """
-    openai_api_key = os.environ.get("OPENAI_API_KEY")
-    linkup_api_key = os.environ.get("LINKUP_API_KEY")
-    if not openai_api_key:
-        raise RuntimeError("OPENAI_API_KEY is required")
-    if not linkup_api_key:
-        raise RuntimeError("LINKUP_API_KEY is required")
-
-    openai_client = OpenAI(api_key=openai_api_key)
-    linkup_client = LinkupClient(api_key=linkup_api_key)
-    deepl_key = os.environ.get("DEEPL_AUTH_KEY")
-    deepl_client = deepl.DeepLClient(deepl_key) if deepl_key else None
+    _require_api_keys()
+    openai_client = _get_openai()
 
-    tools = create_tools_schema()
+    tools = _TOOLS_SCHEMA
 
-    # System guidance for minimal-input local news workflow
     input_list: list[dict[str, Any]] = [
-        {
-            "role": "system",
-            "content": (
-                "When asked for local news, infer the place from the user's text and determine its native language."
-                " Common mappings: Chennai/Tamil Nadu = Tamil, Mumbai/Maharashtra = Marathi, Delhi = Hindi,"
-                " Kolkata/West Bengal = Bengali, Bangalore/Karnataka = Kannada, Hyderabad/Telangana = Telugu, etc."
-                " EXAMPLE: For 'Chennai news' -> use find_local_sources_by_place(place='Chennai', native_language='Tamil')"
-                " First discover local news websites for the place REQUIRING sources in the area's native language"
-                " using find_local_sources_by_place, then search those sites for recent updates using search_local_news."
-                " Write the final answer in English, translating brief quotes if necessary (you may call translate_text)."
-                " Always include concise citations to the strongest local sources."
-                " You MUST always specify the native language when calling these functions."
-            ),
-        },
+        _NEWS_SYSTEM_MSG,
         {
             "role": "user",
             "content": query,
         },
     ]
 
+    ctx = _ToolContext(
+        default_query=query,
+        default_place=query,
+        sources_query=_local_sources_query,
+        news_query=_local_news_query,
+    )
+
     # Simple multi-turn tool loop to allow sequential tool calls
     max_iterations = 3
     last_response = None
     for _ in range(max_iterations):
-        response = openai_client.responses.create(
-            model="gpt-5-nano",
-            tools=tools,
-            input=input_list,
+        response = _create_response(
+            openai_client, tools, input_list, _NEWS_PROMPT_CACHE_KEY
         )
         last_response = response
         input_list += response.output
 
-        made_tool_call = False
-        for item in response.output:
-            if getattr(item, "type", None) == "function_call":
-                made_tool_call = True
-                name = getattr(item, "name", None)
-                args = json.loads(getattr(item, "arguments", "{}"))
-
-                if name == "search_web":
-                    q = args.get("query") or query
-                    linkup_response = linkup_client.search(
-                        query=q,
-                        depth="standard",
-                        output_type="searchResults",
-                        include_images=False,
-                    )
-                    output_json = json.dumps(linkup_response.model_dump(), indent=2)
-                    input_list.append(
-                        {
-                            "type": "function_call_output",
-                            "call_id": getattr(item, "call_id", "search_web_call"),
-                            "output": output_json,
-                        }
-                    )
-
-                elif name == "translate_text":
-                    if not deepl_client:
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "translate_text_call"
-                                ),
-                                "output": json.dumps(
-                                    {
-                                        "error": "DEEPL_AUTH_KEY not set; translation unavailable",
-                                    }
-                                ),
-                            }
-                        )
-                    else:
-                        text = args.get("text", "")
-                        target_lang = args.get("target_lang", "EN")
-                        source_lang = args.get("source_lang")
-                        formality = args.get("formality")
-                        translated = deepl_client.translate_text(
-                            text,
-                            target_lang=target_lang,
-                            source_lang=source_lang,
-                            formality=formality,
-                        )
-                        translated_text = (
-                            translated.text
-                            if hasattr(translated, "text")
-                            else str(translated)
-                        )
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "translate_text_call"
-                                ),
-                                "output": json.dumps(
-                                    {"translated_text": translated_text}
-                                ),
-                            }
-                        )
-
-                elif name == "find_local_sources_by_place":
-                    place = args.get("place") or query
-                    native_language = args.get("native_language")
-                    top_n = args.get("top_n") or 10
-                    if not place:
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "find_local_sources_call"
-                                ),
-                                "output": json.dumps({"error": "place is required"}),
-                            }
-                        )
-                    elif not native_language:
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "find_local_sources_call"
-                                ),
-                                "output": json.dumps(
-                                    {"error": "native_language is required"}
-                                ),
-                            }
-                        )
-                    else:
-                        language_phrase = f" in {native_language}"
-                        if native_language.lower() == "tamil":
-                            q2 = f"local news websites for {place}{language_phrase}; தமிழ் செய்திகள்; Tamil newspaper; official newspaper, tv, radio sites; {native_language} language only"
-                        else:
-                            q2 = f"local news websites for {place}{language_phrase}; official newspaper, tv, radio sites; {native_language} language only"
-                        linkup_response = linkup_client.search(
-                            query=q2,
-                            depth="standard",
-                            output_type="searchResults",
-                            include_images=False,
-                        )
-
-                        def extract_urls_from_obj(obj: Any) -> list[str]:
-                            collected: list[str] = []
-                            if isinstance(obj, dict):
-                                for key, value in obj.items():
-                                    if key.lower() == "url" and isinstance(value, str):
-                                        collected.append(value)
-                                    else:
-                                        collected.extend(extract_urls_from_obj(value))
-                            elif isinstance(obj, list):
-                                for element in obj:
-                                    collected.extend(extract_urls_from_obj(element))
-                            return collected
-
-                        raw_dump = linkup_response.model_dump()
-                        all_urls = extract_urls_from_obj(raw_dump)
-                        seen: set[str] = set()
-                        deduped_urls: list[str] = []
-                        for url in all_urls:
-                            if url not in seen:
-                                seen.add(url)
-                                deduped_urls.append(url)
-                        sites = deduped_urls[: int(top_n)]
-
-                        output_payload = {
-                            "place": place,
-                            "native_language": native_language,
-                            "sites": sites,
-                        }
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "find_local_sources_call"
-                                ),
-                                "output": json.dumps(output_payload),
-                            }
-                        )
-
-                elif name == "search_local_news":
-                    place = args.get("place") or query
-                    sites = args.get("sites") or []
-                    native_language = args.get("native_language")
-                    since_days = int(args.get("since_days") or 7)
-                    if not place:
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "search_local_news_call"
-                                ),
-                                "output": json.dumps({"error": "place is required"}),
-                            }
-                        )
-                    elif not native_language:
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "search_local_news_call"
-                                ),
-                                "output": json.dumps(
-                                    {"error": "native_language is required"}
-                                ),
-                            }
-                        )
-                    else:
-                        site_filter = ""
-                        if isinstance(sites, list) and len(sites) > 0:
-                            site_terms = []
-                            for s in sites[:10]:
-                                site_terms.append(f"site:{s}")
-                            site_filter = "(" + " OR ".join(site_terms) + ") "
-                        language_phrase = f" in {native_language}"
-                        if native_language.lower() == "tamil":
-                            q3 = f"{site_filter}{place} local news{language_phrase} last {since_days} days; தமிழ் செய்திகள்; Tamil news; {native_language} language content only"
-                        else:
-                            q3 = f"{site_filter}{place} local news{language_phrase} last {since_days} days; {native_language} language content only"
-                        linkup_response = linkup_client.search(
-                            query=q3,
-                            depth="standard",
-                            output_type="searchResults",
-                            include_images=False,
-                        )
-                        output_json = json.dumps(linkup_response.model_dump(), indent=2)
-                        input_list.append(
-                            {
-                                "type": "function_call_output",
-                                "call_id": getattr(
-                                    item, "call_id", "search_local_news_call"
-                                ),
-                                "output": output_json,
-                            }
-                        )
-
-        if not made_tool_call:
+        outputs = _run_tool_calls(response.output, ctx)
+        if not outputs:
             break
+        input_list += outputs
 
     # If loop ended without further tool calls, last_response contains the answer
     if last_response is not None:
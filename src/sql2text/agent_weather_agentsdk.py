@@ -1,43 +1,217 @@
 import argparse
+import asyncio
+import hashlib
 import json
 import os
+import sqlite3
+import threading
+import time
 from typing import Any, Optional
 
 import deepl
-from agents import Agent, Runner
+from agents import Agent, Runner, set_default_openai_client
 from linkup import LinkupClient
+from openai import AsyncOpenAI
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
-def fetch_weather_context(city: str, linkup_api_key: str) -> dict[str, Any]:
-    client = LinkupClient(api_key=linkup_api_key)
+
+# Clients keyed by API key and reused across calls, so their HTTP sessions (and the
+# TLS connections in them) survive between searches and translations
+_linkup_clients: dict[str, LinkupClient] = {}
+_deepl_clients: dict[str, deepl.DeepLClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_linkup(linkup_api_key: str) -> LinkupClient:
+    with _clients_lock:
+        client = _linkup_clients.get(linkup_api_key)
+        if client is None:
+            client = _linkup_clients[linkup_api_key] = LinkupClient(
+                api_key=linkup_api_key
+            )
+        return client
+
+
+def _get_deepl(deepl_key: str) -> deepl.DeepLClient:
+    with _clients_lock:
+        client = _deepl_clients.get(deepl_key)
+        if client is None:
+            client = _deepl_clients[deepl_key] = deepl.DeepLClient(deepl_key)
+        return client
+
+
+async def fetch_weather_context(city: str, linkup_api_key: str) -> dict[str, Any]:
+    # LinkupClient.search is blocking, so keep it off the event loop
+    return await asyncio.to_thread(_fetch_weather_context_sync, city, linkup_api_key)
+
+
+def _fetch_weather_context_sync(city: str, linkup_api_key: str) -> dict[str, Any]:
+    client = _get_linkup(linkup_api_key)
     # Simple search geared towards current conditions
     query = f"current weather in {city}"
     result = client.search(query=query, depth="standard", output_type="searchResults")
-    return result.model_dump()
+    # Only what the summary needs goes into the prompt
+    return {
+        "results": [
+            {
+                "name": getattr(item, "name", ""),
+                "url": getattr(item, "url", ""),
+                "content": getattr(item, "content", ""),
+            }
+            for item in result.results
+        ]
+    }
+
+
+def _compact_json(obj: Any) -> str:
+    # No indentation: the JSON is prompt input, and whitespace only costs tokens
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
 
 
 def maybe_translate(
-    text: str, target_lang: Optional[str], deepl_key: Optional[str]
+    text: str,
+    target_lang: Optional[str],
+    deepl_key: Optional[str],
+    source_lang: str = "EN",
 ) -> str:
     if not target_lang:
         return text
     if not deepl_key:
         return text
-    translator = deepl.DeepLClient(deepl_key)
+    # Targets may carry a region ("EN-US"); compare base languages only
+    if target_lang.split("-")[0].upper() == source_lang.split("-")[0].upper():
+        return text
+    translator = _get_deepl(deepl_key)
     translated = translator.translate_text(text, target_lang=target_lang)
     return translated.text if hasattr(translated, "text") else str(translated)
 
 
+_INSTRUCTIONS = (
+    "You are a helpful assistant. You will be given structured 'search_results' "
+    "from Linkup and a 'city'. Summarize the current weather for that city "
+    "in 3-5 sentences and include 1-2 inline citations to the most relevant sources."
+)
+
+# Runner only reads the agent, so one instance serves every run()
+_AGENT = Agent(name="Weather Reporter", instructions=_INSTRUCTIONS)
+
+
 def build_agent() -> Agent:
-    return Agent(
-        name="Weather Reporter",
-        instructions=(
-            "You are a helpful assistant. You will be given structured 'search_results' "
-            "from Linkup and a 'city'. Summarize the current weather for that city "
-            "in 3-5 sentences and include 1-2 inline citations to the most relevant sources. "
-            "If 'translated_summary' is provided, output only that final translated text."
-        ),
-    )
+    return _AGENT
+
+
+# On-disk cache of agent outputs, so a repeated query skips the LLM round-trips
+_SUMMARY_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "sql2text", "weather_summaries.sqlite3"
+)
+_SUMMARY_CACHE_TTL_SECONDS = 60 * 60
+
+_summary_cache_db: Optional[sqlite3.Connection] = None
+# The connection is shared by the worker threads the cache I/O runs in
+_summary_cache_lock = threading.Lock()
+
+
+def _get_summary_cache() -> Optional[sqlite3.Connection]:
+    """Open the summary cache on first use; returns None if it cannot be created."""
+    global _summary_cache_db
+    if _summary_cache_db is None:
+        try:
+            os.makedirs(os.path.dirname(_SUMMARY_CACHE_PATH), exist_ok=True)
+            db = sqlite3.connect(_SUMMARY_CACHE_PATH, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS summaries "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, output TEXT NOT NULL)"
+            )
+            db.execute(
+                "DELETE FROM summaries WHERE stored_at < ?",
+                (time.time() - _SUMMARY_CACHE_TTL_SECONDS,),
+            )
+            db.commit()
+        except (OSError, sqlite3.Error):
+            return None
+        _summary_cache_db = db
+    return _summary_cache_db
+
+
+def _summary_key(**fields: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(fields, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def _load_summary(key: str) -> Optional[str]:
+    with _summary_cache_lock:
+        db = _get_summary_cache()
+        if db is None:
+            return None
+        try:
+            row = db.execute(
+                "SELECT output FROM summaries WHERE key = ? AND stored_at >= ?",
+                (key, time.time() - _SUMMARY_CACHE_TTL_SECONDS),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+    return row[0] if row is not None else None
+
+
+def _store_summary(key: str, output: str) -> None:
+    with _summary_cache_lock:
+        db = _get_summary_cache()
+        if db is None:
+            return
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO summaries (key, stored_at, output) VALUES (?, ?, ?)",
+                (key, time.time(), output),
+            )
+            db.commit()
+        except sqlite3.Error:
+            pass
+
+
+async def _cached_run(agent: Agent, key: str, **run_kwargs: Any) -> str:
+    """`Runner.run(agent, **run_kwargs).final_output`, served from disk when cached."""
+    # sqlite calls block, so keep them off the event loop like the HTTP clients
+    cached = await asyncio.to_thread(_load_summary, key)
+    if cached is not None:
+        return cached
+
+    result = await Runner.run(agent, **run_kwargs)
+    output = result.final_output
+    if isinstance(output, str):
+        await asyncio.to_thread(_store_summary, key, output)
+    return output
+
+
+# Created on first use and installed as the agents SDK default, so every run()
+# reuses one client and its connection pool
+_openai_client: Optional[AsyncOpenAI] = None
+
+
+def _get_openai(openai_key: str) -> AsyncOpenAI:
+    global _openai_client
+    with _clients_lock:
+        if _openai_client is None:
+            _openai_client = AsyncOpenAI(api_key=openai_key)
+            set_default_openai_client(_openai_client)
+        return _openai_client
+
+
+async def _warm_up_openai(client: AsyncOpenAI) -> None:
+    """Open the OpenAI connection early with a small authenticated `models.list` call.
+
+    Failures are ignored since the real call will surface them.
+    """
+    try:
+        await client.models.list()
+    except Exception:
+        pass
 
 
 async def run(city: str, target_lang: Optional[str]) -> str:
@@ -48,47 +222,49 @@ async def run(city: str, target_lang: Optional[str]) -> str:
     if not linkup_key:
         raise RuntimeError("LINKUP_API_KEY is required")
 
-    # Get weather context
-    search_results = fetch_weather_context(city, linkup_key)
+    # Only a new client needs warming; later runs reuse its open connections
+    warm_up = _openai_client is None
+    client = _get_openai(openai_key)
+    # Not awaited: a cached summary never talks to OpenAI, so nothing waits on it
+    warm_up_task = asyncio.create_task(_warm_up_openai(client)) if warm_up else None
+    try:
+        return await _summarize(city, target_lang, linkup_key)
+    finally:
+        if warm_up_task is not None:
+            warm_up_task.cancel()
 
-    # Let the agent draft an English summary first
+
+async def _summarize(city: str, target_lang: Optional[str], linkup_key: str) -> str:
     agent = build_agent()
-    english = await Runner.run(
+    search_results = await fetch_weather_context(city, linkup_key)
+
+    # Let the agent draft an English summary first
+    search_results_json = _compact_json(search_results)
+    results_hash = hashlib.sha256(search_results_json.encode("utf-8")).hexdigest()
+    summary_en = await _cached_run(
         agent,
+        _summary_key(
+            model=agent.name, stage="summary", city=city, results_hash=results_hash
+        ),
         input=(
             "Summarize the current weather using the provided data. "
             "Return a concise, cited answer."
         ),
         context={
             "city": city,
-            "search_results": json.dumps(search_results, indent=2),
+            "search_results": search_results_json,
         },
     )
 
-    summary_en = english.final_output
-
-    # Optionally translate
-    translated_summary = maybe_translate(
+    # Optionally translate; DeepL's output is returned as-is, with no second agent
+    # pass just to echo it
+    return await asyncio.to_thread(
+        maybe_translate,
         text=summary_en,
         target_lang=target_lang,
         deepl_key=os.environ.get("DEEPL_AUTH_KEY"),
     )
 
-    if target_lang and translated_summary:
-        # Return translated only per agent instruction
-        final = await Runner.run(
-            agent,
-            input=(
-                "Output only the translated summary provided in context; do not add extra text."
-            ),
-            context={
-                "translated_summary": translated_summary,
-            },
-        )
-        return final.final_output
-
-    return summary_en
-
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -103,8 +279,6 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    import asyncio
-
     result = asyncio.run(run(args.city, args.target_lang))
     print(result)
 
@@ -0,0 +1,101 @@
+import asyncio
+import atexit
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncLoopThread:
+    """One event loop running in a background thread, shared by synchronous callers.
+
+    Coroutines submitted from any thread run on the same loop, so objects bound to it
+    (pooled MCP sessions, locks, queues) stay usable across calls.
+    """
+
+    _instance: Optional["AsyncLoopThread"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_forever, name="sql2text-event-loop", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def get(cls) -> "AsyncLoopThread":
+        """Return the shared loop thread, starting it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.stop)
+            return cls._instance
+
+    def _run_forever(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedule `coro` on the shared loop and return a concurrent future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run `coro` on the shared loop and block until it finishes."""
+        return self.submit(coro).result()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Cancel pending tasks, stop the loop and join its thread."""
+        if self.loop.is_closed():
+            return
+        if self.loop.is_running():
+            try:
+                self.submit(self._cancel_pending()).result(timeout=timeout)
+            except Exception:
+                pass
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=timeout)
+        if not self._thread.is_alive():
+            self.loop.close()
+        with AsyncLoopThread._instance_lock:
+            if AsyncLoopThread._instance is self:
+                AsyncLoopThread._instance = None
+
+    async def _cancel_pending(self) -> None:
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.loop.shutdown_asyncgens()
+
+
+class MCPClientWrapper:
+    """Synchronous facade over MCPClickHouseClient running on the shared loop."""
+
+    def __init__(self, server_params=None):
+        from sql2text._logging import configure_logging
+        from sql2text.example import MCPClickHouseClient
+
+        configure_logging()
+        self._loop_thread = AsyncLoopThread.get()
+        self._client = MCPClickHouseClient(server_params)
+
+    def connect(self) -> None:
+        self._loop_thread.run(self._client.connect())
+
+    def execute_query(self, sql: str) -> List[Dict]:
+        return self._loop_thread.run(self._client.execute_query(sql))
+
+    def get_table_schema(self, table_name: str) -> str:
+        return self._loop_thread.run(self._client.get_table_schema(table_name))
+
+    def get_sample_data(self, table_name: str, limit: int = 5) -> str:
+        return self._loop_thread.run(self._client.get_sample_data(table_name, limit))
+
+    def list_tables(self) -> List[str]:
+        return self._loop_thread.run(self._client.list_tables())
+
+    def close(self) -> None:
+        self._loop_thread.run(self._client.disconnect())
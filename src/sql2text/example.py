@@ -1,41 +1,45 @@
 import asyncio
-import json
+import importlib.util
+import logging
 import os
-from pathlib import Path
-from typing import Dict, List, Optional
+import shutil
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from agents import Agent, Runner
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from sql2text._logging import configure_logging
+from sql2text._mcp_config import _find_mcp_config_path, _json_loads, _load_mcp_config
 
-def _find_mcp_config_path(explicit_path: Optional[str] = None) -> Optional[str]:
-    """Find the mcp-config.json path.
+# Status and error messages; agent output and prompts still go to stdout via print
+logger = logging.getLogger("sql2text")
 
-    Order of precedence:
-    1) explicit path provided
-    2) current working directory
-    3) project root (three parents up from this file)
-    """
-    if explicit_path:
-        p = Path(explicit_path)
-        if p.is_file():
-            return str(p)
+@lru_cache(maxsize=1)
+def _collect_clickhouse_env_from_os() -> Tuple[Tuple[str, str], ...]:
+    """Collect CLICKHOUSE_* environment variables from the OS.
 
-    cwd_candidate = Path.cwd() / "mcp-config.json"
-    if cwd_candidate.is_file():
-        return str(cwd_candidate)
-
-    project_root_candidate = Path(__file__).resolve().parents[2] / "mcp-config.json"
-    if project_root_candidate.is_file():
-        return str(project_root_candidate)
+    Scanned once per process; call `_collect_clickhouse_env_from_os.cache_clear()`
+    after changing them at runtime.
+    """
+    return tuple(
+        sorted((k, v) for k, v in os.environ.items() if k.startswith("CLICKHOUSE_"))
+    )
 
-    return None
 
+def _resolve_fast_command(server_name: str) -> Tuple[str, List[str]]:
+    """Return the command that starts `server_name` with the least start-up work.
 
-def _collect_clickhouse_env_from_os() -> Dict[str, str]:
-    """Collect CLICKHOUSE_* environment variables from the OS."""
-    return {k: v for k, v in os.environ.items() if k.startswith("CLICKHOUSE_")}
+    An installed `server_name` executable (e.g. from `uv tool install`) is run
+    directly; otherwise uvx resolves and launches the package on demand.
+    """
+    installed = shutil.which(server_name)
+    if installed:
+        return installed, []
+    return "uvx", ["--python", "3.10", server_name]
 
 
 def load_mcp_server_params(
@@ -45,23 +49,21 @@ def load_mcp_server_params(
 
     - If mcp-config.json exists and contains the server, use its command/args/env.
     - Overlay any CLICKHOUSE_* values from the current environment (env overrides file).
-    - If no config is found, fall back to a sensible default using uvx and only OS env.
+    - If no config is found, run an installed server directly, or fall back to uvx.
     """
     path = _find_mcp_config_path(config_path or os.environ.get("MCP_CONFIG_PATH"))
 
-    command: str = "uvx"
-    args: List[str] = ["--python", "3.10", server_name]
+    command, args = _resolve_fast_command(server_name)
     env: Dict[str, str] = {}
 
     if path:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                cfg = json.load(f)
+            cfg = _load_mcp_config(path)
             servers = cfg.get("mcpServers", {})
             server_cfg = servers.get(server_name)
             if server_cfg:
                 command = server_cfg.get("command", command)
-                args = server_cfg.get("args", args)
+                args = list(server_cfg.get("args", args))
                 file_env = server_cfg.get("env", {}) or {}
                 env.update(file_env)
         except Exception:
@@ -69,22 +71,29 @@ def load_mcp_server_params(
             pass
 
     # Overlay with OS environment CLICKHOUSE_* (take precedence)
-    env.update(_collect_clickhouse_env_from_os())
+    env.update(dict(_collect_clickhouse_env_from_os()))
+
+    # Keep uvx on the caller's package cache so a prewarmed download is reused
+    uv_cache_dir = os.environ.get("UV_CACHE_DIR")
+    if uv_cache_dir:
+        env.setdefault("UV_CACHE_DIR", uv_cache_dir)
 
     return StdioServerParameters(command=command, args=args, env=env)
 
 
 def load_mcp_http_url(
-    server_name: str = "clickhouse-remote", config_path: Optional[str] = None
+    server_name: str = "clickhouse-remote",
+    config_path: Optional[str] = None,
+    env_var: str = "MCP_URL",
 ) -> Optional[str]:
     """Return remote MCP server URL from config or env if available.
 
     Order of precedence:
-    1) MCP_URL env var
+    1) `env_var` env var (MCP_URL by default)
     2) mcp-config.json -> mcpServers[server_name].url
     """
     # Highest precedence: explicit env var
-    url_env = os.environ.get("MCP_URL")
+    url_env = os.environ.get(env_var)
     if url_env:
         return url_env
 
@@ -93,8 +102,7 @@ def load_mcp_http_url(
         return None
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            cfg = json.load(f)
+        cfg = _load_mcp_config(path)
         servers = cfg.get("mcpServers", {})
         server_cfg = servers.get(server_name, {})
         url = server_cfg.get("url")
@@ -106,60 +114,158 @@ def load_mcp_http_url(
     return None
 
 
+async def _enter_session(stack: AsyncExitStack, transport) -> ClientSession:
+    """Open `transport`, start an initialized ClientSession on it and register both on `stack`.
+
+    Nothing is left on `stack` if any step fails, so callers can try another transport.
+    """
+    async with AsyncExitStack() as attempt:
+        # Streamable HTTP also yields a session-id getter after the two streams
+        read, write, *_ = await attempt.enter_async_context(transport)
+        session = await attempt.enter_async_context(ClientSession(read, write))
+        await session.initialize()
+        stack.push_async_exit(attempt.pop_all())
+    return session
+
+
+# HTTP/2 needs the optional h2 package; without it httpx stays on HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _mcp_httpx_client(headers=None, timeout=None, auth=None):
+    """httpx client for Streamable HTTP that keeps its connection open between calls.
+
+    Tool calls reuse one keep-alive connection (multiplexed over HTTP/2 when h2 is
+    installed) instead of reconnecting after short idle gaps.
+    """
+    import httpx
+
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout or httpx.Timeout(30.0, read=300.0),
+        auth=auth,
+        follow_redirects=True,
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(keepalive_expiry=60.0),
+    )
+
+
 class MCPClickHouseClient:
     """Client that communicates with ClickHouse through MCP server."""
 
+    # Seconds a cached schema or table list stays valid
+    metadata_ttl: float = 300.0
+
     def __init__(self, server_params: Optional[StdioServerParameters] = None):
         self.session = None
         self._server_params = server_params
+        self._runner: Optional[asyncio.Task] = None
+        self._closing: Optional[asyncio.Event] = None
+        # Set while a connect is in flight, so concurrent callers share it
+        self._connecting: Optional[asyncio.Future] = None
+        # Table schemas and the table list rarely change within a session; cache
+        # them as (expires_at, value) so follow-up questions skip the round-trip
+        self._schema_cache: Dict[str, Tuple[float, str]] = {}
+        self._tables_cache: Optional[Tuple[float, List[str]]] = None
 
     async def connect(self):
-        """Connect to the MCP ClickHouse server using config-first settings."""
+        """Connect to the MCP ClickHouse server using config-first settings.
+
+        The transport is opened in a dedicated background task and kept open until
+        `disconnect()` is called, so the session can be reused across queries.
+        """
+        if self.session is not None:
+            return
+        if self._connecting is not None:
+            await asyncio.shield(self._connecting)
+            return
+
+        loop = asyncio.get_running_loop()
+        ready: asyncio.Future = loop.create_future()
+        self._connecting = ready
+        self._closing = asyncio.Event()
+        self._runner = asyncio.create_task(self._run(ready))
+        try:
+            await ready
+        except Exception as e:
+            self._runner = None
+            logger.error(f"❌ Failed to connect to MCP ClickHouse server: {e}")
+            raise
+        finally:
+            self._connecting = None
+
+    async def disconnect(self):
+        """Close the session and tear down the underlying transport."""
+        if self._runner is None:
+            return
+        self._closing.set()
+        try:
+            await self._runner
+        finally:
+            self._runner = None
+            self.session = None
+
+    async def _run(self, ready: asyncio.Future):
+        """Own the transport for the lifetime of the connection."""
         try:
-            # Prefer remote HTTP URL if configured; otherwise fall back to stdio
-            http_url = load_mcp_http_url()
-            if http_url:
-                # Try HTTP client first (if supported by mcp)
+            async with AsyncExitStack() as stack:
+                self.session = await self._open_session(stack)
+                ready.set_result(None)
+                await self._closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"⚠️  MCP ClickHouse connection closed with error: {e}")
+        finally:
+            self.session = None
+            if not ready.done():
+                ready.cancel()
+
+    async def _open_session(self, stack: AsyncExitStack) -> ClientSession:
+        # Prefer remote HTTP URL if configured; otherwise fall back to stdio
+        http_url = load_mcp_http_url()
+        if http_url:
+            # Try Streamable HTTP first; a local `mcp_daemon.py` server speaks it
+            try:
+                from mcp.client.streamable_http import streamablehttp_client
+
+                transport = streamablehttp_client(
+                    http_url, httpx_client_factory=_mcp_httpx_client
+                )
+                session = await _enter_session(stack, transport)
+                logger.info("✅ Connected to ClickHouse Remote MCP server (HTTP)!")
+                return session
+            except Exception:
+                pass
+            # Try HTTP client next (if supported by mcp)
+            try:
+                from mcp.client.http import http_client  # type: ignore
+
+                session = await _enter_session(stack, http_client(http_url))
+                logger.info("✅ Connected to ClickHouse Remote MCP server (HTTP)!")
+                return session
+            except Exception:
+                # Try SSE client fallback if available
                 try:
-                    from mcp.client.http import http_client  # type: ignore
-
-                    async with http_client(http_url) as (read, write):
-                        async with ClientSession(read, write) as session:
-                            self.session = session
-                            print(
-                                "✅ Connected to ClickHouse Remote MCP server (HTTP)!"
-                            )
-                            return
-                except Exception:
-                    # Try SSE client fallback if available
-                    try:
-                        from mcp.client.sse import sse_client  # type: ignore
-
-                        async with sse_client(http_url) as (read, write):
-                            async with ClientSession(read, write) as session:
-                                self.session = session
-                                print(
-                                    "✅ Connected to ClickHouse Remote MCP server (SSE)!"
-                                )
-                                return
-                    except Exception as e:
-                        print(
-                            f"⚠️  Remote MCP connection failed, falling back to stdio: {e}"
-                        )
-
-            server_params = self._server_params or load_mcp_server_params(
-                server_name="mcp-clickhouse"
-            )
+                    from mcp.client.sse import sse_client  # type: ignore
+
+                    session = await _enter_session(stack, sse_client(http_url))
+                    logger.info("✅ Connected to ClickHouse Remote MCP server (SSE)!")
+                    return session
+                except Exception as e:
+                    logger.warning(
+                        f"⚠️  Remote MCP connection failed, falling back to stdio: {e}"
+                    )
 
-            # Connect to the MCP server via stdio
-            async with stdio_client(server_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    self.session = session
-                    print("✅ Connected to ClickHouse MCP server (stdio) successfully!")
+        server_params = self._server_params or load_mcp_server_params(
+            server_name="mcp-clickhouse"
+        )
 
-        except Exception as e:
-            print(f"❌ Failed to connect to MCP ClickHouse server: {e}")
-            raise
+        # Connect to the MCP server via stdio
+        session = await _enter_session(stack, stdio_client(server_params))
+        logger.info("✅ Connected to ClickHouse MCP server (stdio) successfully!")
+        return session
 
     async def execute_query(self, sql: str) -> List[Dict]:
         """Execute SQL query through MCP server and return results."""
@@ -171,20 +277,26 @@ class MCPClickHouseClient:
             result = await self.session.call_tool("execute_query", {"sql": sql})
             return result.content[0].text if result.content else []
         except Exception as e:
-            print(f"❌ Query execution failed: {e}")
+            logger.error(f"❌ Query execution failed: {e}")
             raise
 
     async def get_table_schema(self, table_name: str) -> str:
         """Get schema information for a table through MCP server."""
+        cached = self._schema_cache.get(table_name)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
         try:
             result = await self.session.call_tool(
                 "describe_table", {"table_name": table_name}
             )
-            return (
-                result.content[0].text
-                if result.content
-                else f"Could not retrieve schema for {table_name}"
+            if not result.content:
+                return f"Could not retrieve schema for {table_name}"
+            schema = result.content[0].text
+            self._schema_cache[table_name] = (
+                time.monotonic() + self.metadata_ttl,
+                schema,
             )
+            return schema
         except Exception as e:
             return f"Could not retrieve schema for {table_name}: {e}"
 
@@ -204,16 +316,125 @@ class MCPClickHouseClient:
 
     async def list_tables(self) -> List[str]:
         """List available tables through MCP server."""
+        if self._tables_cache and self._tables_cache[0] > time.monotonic():
+            return list(self._tables_cache[1])
         try:
             result = await self.session.call_tool("list_tables", {})
             if result.content:
-                return json.loads(result.content[0].text)
+                tables = _json_loads(result.content[0].text)
+                self._tables_cache = (time.monotonic() + self.metadata_ttl, tables)
+                return list(tables)
             return []
         except Exception as e:
-            print(f"❌ Failed to list tables: {e}")
+            logger.error(f"❌ Failed to list tables: {e}")
             return []
 
 
+class MCPSessionPool:
+    """Keep connected MCPClickHouseClient instances alive between uses.
+
+    Clients are pooled per key (the server URL or config name), so repeated
+    acquisitions reuse an open session instead of spawning the MCP server and
+    repeating the initialize handshake each time.
+    """
+
+    def __init__(self):
+        self._idle: Dict[str, asyncio.Queue] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._clients: List[MCPClickHouseClient] = []
+
+    @asynccontextmanager
+    async def acquire(
+        self, key: str, server_params: Optional[StdioServerParameters] = None
+    ) -> AsyncIterator[MCPClickHouseClient]:
+        """Yield a connected client for `key`, returning it to the pool afterwards."""
+        client = await self._checkout(key, server_params)
+        try:
+            yield client
+        finally:
+            self.release(key, client)
+
+    async def _checkout(
+        self, key: str, server_params: Optional[StdioServerParameters]
+    ) -> MCPClickHouseClient:
+        idle = self._idle.setdefault(key, asyncio.Queue())
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            while not idle.empty():
+                client = idle.get_nowait()
+                if client.session is not None:
+                    return client
+                # Drop clients whose connection went away while idle
+                self._clients.remove(client)
+
+            client = MCPClickHouseClient(server_params)
+            await client.connect()
+            self._clients.append(client)
+            return client
+
+    def release(self, key: str, client: MCPClickHouseClient) -> None:
+        """Return a client to the pool so the next acquire can reuse it."""
+        self._idle.setdefault(key, asyncio.Queue()).put_nowait(client)
+
+    async def close_all(self) -> None:
+        """Disconnect every client created by this pool."""
+        clients, self._clients = self._clients, []
+        self._idle.clear()
+        self._locks.clear()
+        for client in clients:
+            try:
+                await client.disconnect()
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to close MCP session: {e}")
+
+
+# Shared pool so sessions survive across demo and library calls
+mcp_session_pool = MCPSessionPool()
+
+
+class MCPHost:
+    """Hold sessions to several MCP servers and connect them concurrently.
+
+    Clients are checked out of `pool` and handed back when the host is closed,
+    so the underlying transports stay open for the next host.
+    """
+
+    def __init__(self, pool: Optional[MCPSessionPool] = None):
+        self.clients: Dict[str, MCPClickHouseClient] = {}
+        self._pool = pool or mcp_session_pool
+        self._exit_stack = AsyncExitStack()
+
+    @property
+    def pool(self) -> MCPSessionPool:
+        """The pool clients are checked out of; close it to end the transports."""
+        return self._pool
+
+    @property
+    def sessions(self) -> Dict[str, ClientSession]:
+        return {name: client.session for name, client in self.clients.items()}
+
+    async def connect(
+        self, name: str, server_params: Optional[StdioServerParameters] = None
+    ) -> MCPClickHouseClient:
+        """Connect to the server `name`; safe to run several at once with asyncio.gather."""
+        client = await self._exit_stack.enter_async_context(
+            self._pool.acquire(name, server_params)
+        )
+        self.clients[name] = client
+        return client
+
+    async def connect_all(
+        self, servers: List[tuple[str, Optional[StdioServerParameters]]]
+    ) -> None:
+        """Connect to every `(name, params)` pair concurrently."""
+        await asyncio.gather(*(self.connect(name, params) for name, params in servers))
+
+    async def aclose(self) -> None:
+        """Return all clients to the pool."""
+        self.clients.clear()
+        await self._exit_stack.aclose()
+
+
 # Create specialized agents for different SQL-to-text tasks
 sql_analyzer_agent = Agent(
     name="SQL Analyzer",
@@ -275,19 +496,29 @@ async def demonstrate_clickhouse_sql2text():
         # Connect to MCP server
         await mcp_client.connect()
 
-        # Example 1: Analyze a simple query
-        print("=" * 60)
-        print("EXAMPLE 1: Analyzing a simple SQL query")
-        print("=" * 60)
-
         simple_query = "SELECT COUNT(*) as total_users FROM system.users"
-        print(f"SQL Query: {simple_query}")
+        complex_query = """
+        SELECT 
+            database,
+            table,
+            COUNT(*) as column_count
+        FROM system.columns 
+        WHERE database != 'system'
+        GROUP BY database, table
+        ORDER BY column_count DESC
+        LIMIT 10
+        """
 
-        # Execute the query to get context
-        result = await mcp_client.execute_query(simple_query)
+        # Gather the MCP context for examples 1 and 2 together
+        result, available_tables = await asyncio.gather(
+            mcp_client.execute_query(simple_query), mcp_client.list_tables()
+        )
         context = f"Query result: {result[0] if result else 'No result'}"
 
-        # Use the agent to explain the query
+        if available_tables:
+            available_tables = available_tables[:5]  # First 5 tables
+
+        # Example 1: Analyze a simple query
         analysis_prompt = f"""
         Please analyze this SQL query and explain what it does:
         
@@ -300,19 +531,7 @@ async def demonstrate_clickhouse_sql2text():
         3. When you might use this type of query
         """
 
-        analysis_result = await Runner.run(sql_analyzer_agent, input=analysis_prompt)
-        print(f"\nAnalysis: {analysis_result.final_output}")
-
         # Example 2: Explore available data
-        print("\n" + "=" * 60)
-        print("EXAMPLE 2: Exploring available data")
-        print("=" * 60)
-
-        # Get list of tables through MCP
-        available_tables = await mcp_client.list_tables()
-        if available_tables:
-            available_tables = available_tables[:5]  # First 5 tables
-
         exploration_prompt = f"""
         The user wants to explore their ClickHouse database. Here are some available system tables:
         {available_tables}
@@ -323,28 +542,7 @@ async def demonstrate_clickhouse_sql2text():
         3. Suggest some interesting queries they could run
         """
 
-        exploration_result = await Runner.run(
-            data_explorer_agent, input=exploration_prompt
-        )
-        print(f"Data Exploration Guide: {exploration_result.final_output}")
-
         # Example 3: Query optimization
-        print("\n" + "=" * 60)
-        print("EXAMPLE 3: Query optimization advice")
-        print("=" * 60)
-
-        complex_query = """
-        SELECT 
-            database,
-            table,
-            COUNT(*) as column_count
-        FROM system.columns 
-        WHERE database != 'system'
-        GROUP BY database, table
-        ORDER BY column_count DESC
-        LIMIT 10
-        """
-
         optimization_prompt = f"""
         Please analyze this ClickHouse query for performance and provide optimization suggestions:
         
@@ -357,39 +555,58 @@ async def demonstrate_clickhouse_sql2text():
         4. Alternative approaches
         """
 
-        optimization_result = await Runner.run(
-            query_optimizer_agent, input=optimization_prompt
+        # The three examples are independent, so run the agents concurrently
+        analysis_result, exploration_result, optimization_result = (
+            await asyncio.gather(
+                Runner.run(sql_analyzer_agent, input=analysis_prompt),
+                Runner.run(data_explorer_agent, input=exploration_prompt),
+                Runner.run(query_optimizer_agent, input=optimization_prompt),
+            )
         )
+
+        print("=" * 60)
+        print("EXAMPLE 1: Analyzing a simple SQL query")
+        print("=" * 60)
+        print(f"SQL Query: {simple_query}")
+        print(f"\nAnalysis: {analysis_result.final_output}")
+
+        print("\n" + "=" * 60)
+        print("EXAMPLE 2: Exploring available data")
+        print("=" * 60)
+        print(f"Data Exploration Guide: {exploration_result.final_output}")
+
+        print("\n" + "=" * 60)
+        print("EXAMPLE 3: Query optimization advice")
+        print("=" * 60)
         print(f"Optimization Analysis: {optimization_result.final_output}")
 
     except Exception as e:
-        print(f"❌ Error during demonstration: {e}")
-        print(
+        logger.error(f"❌ Error during demonstration: {e}")
+        logger.error(
             "Note: Make sure the MCP ClickHouse server is properly configured and accessible."
         )
 
     finally:
-        # MCP client cleanup is handled by the context manager
-        pass
+        await mcp_client.disconnect()
 
 
 async def demonstrate_linkup_remote_mcp():
     """Demonstrate connecting to Linkup Remote MCP and performing a sample search.
 
     Configuration options (order of precedence):
-    1) `mcp-config.json` -> `mcpServers.linkup.url`
-    2) `MCP_URL` env var
+    1) `LINKUP_MCP_URL` env var
+    2) `mcp-config.json` -> `mcpServers.linkup.url`
     3) `LINKUP_API_KEY` env var (constructs https://mcp.linkup.so/sse?apiKey=...)
     """
-    # Resolve Linkup MCP URL
-    url = load_mcp_http_url(server_name="linkup")
+    # Resolve Linkup MCP URL; MCP_URL is left to the ClickHouse server
+    url = load_mcp_http_url(server_name="linkup", env_var="LINKUP_MCP_URL")
     if not url:
         api_key = os.environ.get("LINKUP_API_KEY")
         if api_key:
             url = f"https://mcp.linkup.so/sse?apiKey={api_key}"
 
     if not url:
-        print(
+        logger.info(
             "ℹ️ Linkup Remote MCP not configured. Set `mcpServers.linkup.url` in mcp-config.json "
             "or export LINKUP_API_KEY to construct the URL. See docs: https://docs.linkup.so/pages/integrations/mcp/mcp#remote-mcp"
         )
@@ -401,7 +618,7 @@ async def demonstrate_linkup_remote_mcp():
 
         async with sse_client(url) as (read, write):
             async with ClientSession(read, write) as session:
-                print("✅ Connected to Linkup Remote MCP (SSE)")
+                logger.info("✅ Connected to Linkup Remote MCP (SSE)")
 
                 # Try calling the Linkup search tool
                 sample_query = "Latest updates about the Model Context Protocol; include 3 citations."
@@ -414,11 +631,11 @@ async def demonstrate_linkup_remote_mcp():
                     )
                     print("\n🔎 Linkup Search result (preview):\n" + preview)
                 except Exception as e:
-                    print(
+                    logger.warning(
                         f"⚠️ Could not call 'search' tool on Linkup MCP (this may vary by account/plan): {e}"
                     )
     except Exception as e:
-        print(f"❌ Failed to connect to Linkup Remote MCP: {e}")
+        logger.error(f"❌ Failed to connect to Linkup Remote MCP: {e}")
 
 
 async def interactive_sql2text():
@@ -468,14 +685,14 @@ Available commands:
             print(f"\n{result.final_output}")
 
     except Exception as e:
-        print(f"❌ Error: {e}")
+        logger.error(f"❌ Error: {e}")
     finally:
-        # MCP client cleanup is handled by the context manager
-        pass
+        await mcp_client.disconnect()
 
 
 async def main():
     """Main function to run examples."""
+    configure_logging()
     print("🚀 SQL2Text with ClickHouse MCP Server")
     print("=" * 50)
 
@@ -1,55 +1,37 @@
 import argparse
 import asyncio
 import json
+import logging
 import os
-from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from mcp import ClientSession
 
+from sql2text._logging import configure_logging
+from sql2text._mcp_config import _find_mcp_config_path, _json_loads, _load_mcp_config
 
-def _find_mcp_config_path(explicit_path: Optional[str] = None) -> Optional[str]:
-    """Find the mcp-config.json path.
-
-    Order of precedence:
-    1) explicit path provided
-    2) current working directory
-    3) project root (three parents up from this file)
-    """
-    if explicit_path:
-        p = Path(explicit_path)
-        if p.is_file():
-            return str(p)
-
-    cwd_candidate = Path.cwd() / "mcp-config.json"
-    if cwd_candidate.is_file():
-        return str(cwd_candidate)
-
-    project_root_candidate = Path(__file__).resolve().parents[2] / "mcp-config.json"
-    if project_root_candidate.is_file():
-        return str(project_root_candidate)
-
-    return None
+# Status and error messages; agent output and prompts still go to stdout via print
+logger = logging.getLogger("sql2text")
 
 
 def _load_linkup_url(config_path: Optional[str] = None) -> Optional[str]:
     """Resolve the Linkup Remote MCP URL.
 
     Order of precedence:
-    1) MCP_URL env var (if explicitly set to the Linkup endpoint)
+    1) LINKUP_MCP_URL env var (MCP_URL belongs to the ClickHouse server)
     2) mcp-config.json -> mcpServers["linkup"].url
     3) LINKUP_API_KEY env var -> constructs https://mcp.linkup.so/sse?apiKey=...
     """
     # Highest precedence: explicit env var
-    url_env = os.environ.get("MCP_URL")
+    url_env = os.environ.get("LINKUP_MCP_URL")
     if url_env and url_env.strip():
         return url_env
 
     path = _find_mcp_config_path(config_path or os.environ.get("MCP_CONFIG_PATH"))
     if path:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                cfg = json.load(f)
+            cfg = _load_mcp_config(path)
             servers = cfg.get("mcpServers", {})
             server_cfg = servers.get("linkup", {})
             url = server_cfg.get("url")
@@ -65,6 +47,67 @@ def _load_linkup_url(config_path: Optional[str] = None) -> Optional[str]:
     return None
 
 
+# Tool name and payload key that last worked against each MCP server (keyed by
+# `_schema_cache_id`), so later runs call it directly instead of probing payload shapes
+_MCP_SCHEMA_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "sql2text", "mcp_schema.json"
+)
+
+
+def _load_mcp_schema_cache() -> dict:
+    try:
+        with open(_MCP_SCHEMA_CACHE_PATH, "rb") as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_mcp_schema_cache(cache: dict) -> None:
+    try:
+        os.makedirs(os.path.dirname(_MCP_SCHEMA_CACHE_PATH), exist_ok=True)
+        with open(_MCP_SCHEMA_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _schema_cache_id(url: str) -> str:
+    """Return `url` without its `apiKey` query parameter, so keys never hit disk."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != "apiKey"]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _tool_error(result: Any) -> Optional[Exception]:
+    """Return an `isError` tool result as an exception, or None if the call succeeded.
+
+    Servers report a wrong argument shape this way rather than by raising.
+    """
+    if not getattr(result, "isError", False):
+        return None
+    content = getattr(result, "content", None)
+    return RuntimeError(
+        getattr(content[0], "text", "<no content>") if content else "<no content>"
+    )
+
+
+_QUERY_PAYLOAD_KEYS = ("query", "q", "input", "text")
+
+
+def _query_key_from_schema(tool: Any) -> Optional[str]:
+    """Return the argument name a search tool expects for its query, if declared."""
+    schema = getattr(tool, "inputSchema", None) or {}
+    properties = schema.get("properties") or {}
+    required = schema.get("required") or []
+    for key in _QUERY_PAYLOAD_KEYS:
+        if key in required or key in properties:
+            return key
+    string_required = [
+        key for key in required if properties.get(key, {}).get("type") == "string"
+    ]
+    return string_required[0] if len(string_required) == 1 else None
+
+
 async def demonstrate_linkup_remote_mcp() -> None:
     """Connect to Linkup Remote MCP (SSE) and run a sample `search` query.
 
@@ -73,6 +116,9 @@ async def demonstrate_linkup_remote_mcp() -> None:
     # Optional CLI argument for custom query
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument("--query", type=str, default=None)
+    parser.add_argument("--rediscover", action="store_true")
+    # Send every payload shape at once; faster, but each attempt is a billed call
+    parser.add_argument("--probe-parallel", action="store_true")
     args, _ = parser.parse_known_args()
     user_query = (
         args.query
@@ -80,7 +126,7 @@ async def demonstrate_linkup_remote_mcp() -> None:
     )
     url = _load_linkup_url()
     if not url:
-        print(
+        logger.info(
             "ℹ️ Linkup Remote MCP not configured. Set `mcpServers.linkup.url` in mcp-config.json "
             "or export LINKUP_API_KEY. See: https://docs.linkup.so/pages/integrations/mcp/mcp#remote-mcp"
         )
@@ -91,23 +137,48 @@ async def demonstrate_linkup_remote_mcp() -> None:
 
         async with sse_client(url) as (read, write):
             async with ClientSession(read, write) as session:
-                print("✅ Connected to Linkup Remote MCP (SSE)")
+                logger.info("✅ Connected to Linkup Remote MCP (SSE)")
+
+                schema_cache = {} if args.rediscover else _load_mcp_schema_cache()
+                cache_id = _schema_cache_id(url)
+                cached = schema_cache.get(cache_id)
+                if cached:
+                    try:
+                        result = await session.call_tool(  # type: ignore
+                            cached["tool"], {cached["payload_key"]: user_query}
+                        )
+                        if not getattr(result, "isError", False):
+                            preview = (
+                                result.content[0].text[:500]
+                                if result.content
+                                else "<no content>"
+                            )
+                            print("\n🔎 Linkup Search result (preview):\n" + preview)
+                            return
+                    except Exception:
+                        # Server changed since the shape was cached; rediscover it
+                        pass
 
                 # Try to discover available tools
-                tool_names: List[str] = []
+                tools_by_name: Dict[str, Any] = {}
                 try:
-                    tools = await session.list_tools()  # type: ignore
-                    tool_names = [getattr(t, "name", "") for t in tools]
+                    listed = await session.list_tools()  # type: ignore
+                    tools_by_name = {
+                        t.name: t
+                        for t in getattr(listed, "tools", listed)
+                        if getattr(t, "name", "")
+                    }
                 except Exception:
-                    tool_names = []
+                    tools_by_name = {}
+                tool_names: List[str] = list(tools_by_name)
 
                 if tool_names:
-                    print(
-                        "🧰 Available tools:",
+                    logger.info(
+                        "🧰 Available tools: %s",
                         ", ".join(sorted([t for t in tool_names if t])),
                     )
                 else:
-                    print("ℹ️ Could not list tools from server (continuing)...")
+                    logger.info("ℹ️ Could not list tools from server (continuing)...")
 
                 # Prefer a tool with 'search' in the name
                 selected_tool = None
@@ -119,41 +190,73 @@ async def demonstrate_linkup_remote_mcp() -> None:
                 if not selected_tool:
                     selected_tool = "search"  # best-guess fallback
 
-                # Try multiple payload shapes
-                payload_candidates = [
-                    {"query": user_query},
-                    {"q": user_query},
-                    {"input": user_query},
-                    {"text": user_query},
-                ]
+                # Take the payload key from the tool's input schema when it has one;
+                # otherwise try the common shapes in turn
+                schema_key = _query_key_from_schema(tools_by_name.get(selected_tool))
+                if schema_key:
+                    payload_candidates = [{schema_key: user_query}]
+                else:
+                    payload_candidates = [
+                        {key: user_query} for key in _QUERY_PAYLOAD_KEYS
+                    ]
 
-                last_error: Optional[Exception] = None
-                for payload in payload_candidates:
-                    try:
-                        result = await session.call_tool(selected_tool, payload)  # type: ignore
-                        preview = (
-                            result.content[0].text[:500]
-                            if result.content
-                            else "<no content>"
-                        )
-                        print("\n🔎 Linkup Search result (preview):\n" + preview)
-                        last_error = None
-                        break
-                    except Exception as e:
-                        last_error = e
+                outcomes: List[Any] = []
+                if args.probe_parallel:
+                    gathered = await asyncio.gather(
+                        *(
+                            session.call_tool(selected_tool, payload)  # type: ignore
+                            for payload in payload_candidates
+                        ),
+                        return_exceptions=True,
+                    )
+                    outcomes = [
+                        r if isinstance(r, BaseException) else (_tool_error(r) or r)
+                        for r in gathered
+                    ]
+                else:
+                    for payload in payload_candidates:
+                        try:
+                            result = await session.call_tool(  # type: ignore
+                                selected_tool, payload
+                            )
+                        except Exception as e:
+                            outcomes.append(e)
+                            continue
+                        error = _tool_error(result)
+                        outcomes.append(error or result)
+                        if error is None:
+                            break
+
+                last_error: Optional[BaseException] = None
+                for payload, result in zip(payload_candidates, outcomes):
+                    if isinstance(result, BaseException):
+                        last_error = result
+                        continue
+                    preview = (
+                        result.content[0].text[:500] if result.content else "<no content>"
+                    )
+                    print("\n🔎 Linkup Search result (preview):\n" + preview)
+                    last_error = None
+                    schema_cache[cache_id] = {
+                        "tool": selected_tool,
+                        "payload_key": next(iter(payload)),
+                    }
+                    _save_mcp_schema_cache(schema_cache)
+                    break
 
                 if last_error:
-                    print(
+                    logger.warning(
                         "⚠️ Could not invoke a search tool on Linkup MCP. "
                         "Available tools: "
                         + (", ".join(tool_names) if tool_names else "<unknown>")
                         + f". Last error: {last_error}"
                     )
     except Exception as e:
-        print(f"❌ Failed to connect to Linkup Remote MCP: {e}")
+        logger.error(f"❌ Failed to connect to Linkup Remote MCP: {e}")
 
 
 async def main() -> None:
+    configure_logging()
     await demonstrate_linkup_remote_mcp()
 
 